@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections.abc import Callable
+import os
 import sys
 from typing import Any
 
@@ -85,3 +87,18 @@ def _mock_platform(monkeypatch: pytest.MonkeyPatch) -> None:
     """
     monkeypatch.setattr(sys, "platform", "linux")
     monkeypatch.setenv("SHELL", "/bin/sh")
+
+
+@pytest.fixture
+def age_mtime() -> Callable[..., None]:
+    """Return a helper that moves a path's mtime the given seconds into the past.
+
+    The stat-keyed caches ignore anything modified within the last second, so
+    tests that expect a cache hit age the path out of that window first.
+    """
+
+    def age(path: str | os.PathLike[str], seconds: int = 10) -> None:
+        st = os.stat(path)
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns - seconds * 1_000_000_000))
+
+    return age
@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import subprocess
+
+import pytest
+
+from vibe.core.tools.base import ToolError
+from vibe.core.tools.builtins.commit_suggestion import (
+    CommitSuggestion,
+    CommitSuggestionArgs,
+    CommitSuggestionState,
+    CommitSuggestionToolConfig,
+    FileDiff,
+    _PatchPreviews,
+)
+
+
+def _git(root, *args):
+    subprocess.run(["git", *args], cwd=root, capture_output=True, check=True)
+
+
+@pytest.fixture
+def git_repo(tmp_path):
+    _git(tmp_path, "init")
+    _git(tmp_path, "config", "user.email", "test@test.com")
+    _git(tmp_path, "config", "user.name", "Test")
+    (tmp_path / "keep.txt").write_text("one\ntwo\n")
+    (tmp_path / "gone.txt").write_text("bye\n")
+    (tmp_path / "old name.txt").write_text("same content\n" * 20)
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-m", "Initial commit")
+    return tmp_path
+
+
+def _tool(workdir):
+    config = CommitSuggestionToolConfig(workdir=workdir)
+    return CommitSuggestion(config=config, state=CommitSuggestionState())
+
+
+@pytest.mark.asyncio
+async def test_raises_outside_git_repo(tmp_path):
+    with pytest.raises(ToolError):
+        await _tool(tmp_path).run(CommitSuggestionArgs())
+
+
+@pytest.mark.asyncio
+async def test_reports_unstaged_changes(git_repo):
+    (git_repo / "keep.txt").write_text("changed\n")
+
+    result = await _tool(git_repo).run(CommitSuggestionArgs())
+
+    assert result.has_changes is False
+    assert result.title == "No staged changes"
+
+
+@pytest.mark.asyncio
+async def test_collects_staged_files(git_repo):
+    (git_repo / "keep.txt").write_text("one\nTWO\nthree\n")
+    (git_repo / "gone.txt").unlink()
+    (git_repo / "café [draft].md").write_text("# new\n")
+    _git(git_repo, "mv", "old name.txt", "new name.txt")
+    _git(git_repo, "add", "-A")
+
+    result = await _tool(git_repo).run(CommitSuggestionArgs())
+
+    files = {f.path: f for f in result.files}
+    assert {path: f.status for path, f in files.items()} == {
+        "café [draft].md": "added",
+        "gone.txt": "deleted",
+        "keep.txt": "modified",
+        "new name.txt": "renamed",
+    }
+    assert (files["keep.txt"].additions, files["keep.txt"].deletions) == (2, 1)
+    assert (files["gone.txt"].additions, files["gone.txt"].deletions) == (0, 1)
+    assert files["keep.txt"].diff_preview.startswith("diff --git a/keep.txt")
+    assert "+TWO" in files["keep.txt"].diff_preview
+    assert "+# new" in files["café [draft].md"].diff_preview
+    assert "rename to new name.txt" in files["new name.txt"].diff_preview
+    assert result.stats == "4 files changed, 3 insertions(+), 2 deletions(-)"
+
+
+@pytest.mark.asyncio
+async def test_limits_files_to_max_files(git_repo):
+    for i in range(4):
+        (git_repo / f"f{i}.txt").write_text(f"{i}\n")
+    _git(git_repo, "add", ".")
+
+    result = await _tool(git_repo).run(CommitSuggestionArgs(max_files=2))
+
+    assert [f.path for f in result.files] == ["f0.txt", "f1.txt"]
+    assert all(f.diff_preview for f in result.files)
+
+
+@pytest.mark.asyncio
+async def test_reuses_staged_scan_until_index_changes(git_repo, monkeypatch, age_mtime):
+    tool = _tool(git_repo)
+    (git_repo / "keep.txt").write_text("one\nTWO\n")
+    _git(git_repo, "add", "keep.txt")
+    age_mtime(git_repo / ".git" / "index")
+    await tool.run(CommitSuggestionArgs())
+
+    calls = []
+    run_git = tool._run_git_bytes
+
+    async def counting(workdir, *args):
+        calls.append(args)
+        return await run_git(workdir, *args)
+
+    monkeypatch.setattr(tool, "_run_git_bytes", counting)
+    cached = await tool.run(CommitSuggestionArgs())
+    assert calls == []
+    assert [f.path for f in cached.files] == ["keep.txt"]
+
+    (git_repo / "gone.txt").unlink()
+    _git(git_repo, "add", "gone.txt")
+    age_mtime(git_repo / ".git" / "index")
+    result = await tool.run(CommitSuggestionArgs())
+
+    assert calls
+    assert [f.path for f in result.files] == ["gone.txt", "keep.txt"]
+
+
+@pytest.mark.asyncio
+async def test_rescans_after_commit(git_repo, age_mtime):
+    tool = _tool(git_repo)
+    (git_repo / "keep.txt").write_text("one\nTWO\n")
+    _git(git_repo, "add", "keep.txt")
+    age_mtime(git_repo / ".git" / "index")
+    await tool.run(CommitSuggestionArgs())
+    await tool.run(CommitSuggestionArgs())
+
+    _git(git_repo, "commit", "-m", "Second commit")
+    age_mtime(git_repo / ".git" / "index")
+    result = await tool.run(CommitSuggestionArgs())
+
+    assert result.has_changes is False
+
+
+@pytest.mark.asyncio
+async def test_scopes_title_to_shared_top_directory(git_repo):
+    (git_repo / "src" / "pkg").mkdir(parents=True)
+    (git_repo / "src" / "a.py").write_text("a\n")
+    (git_repo / "src" / "pkg" / "b.py").write_text("b\n")
+    (git_repo / "top.py").write_text("top\n")
+    _git(git_repo, "add", "src")
+
+    result = await _tool(git_repo).run(CommitSuggestionArgs())
+
+    assert result.title == "feat(src): update 2 files"
+
+    _git(git_repo, "add", "top.py")
+    result = await _tool(git_repo).run(CommitSuggestionArgs())
+
+    assert result.title == "feat(src): update 3 files"
+
+
+@pytest.mark.parametrize(
+    ("files", "expected"),
+    [
+        ([("docs/README.md", "modified"), ("tests/test_x.py", "modified")], "test"),
+        ([("src/config.py", "modified"), ("CHANGES.md", "modified")], "docs"),
+        ([("src/config.py", "added"), ("src/fix.py", "added")], "chore"),
+        ([("src/a.py", "added"), ("src/fix_b.py", "added")], "feat"),
+        ([("src/a.py", "added"), ("src/fix_b.py", "modified")], "fix"),
+        ([("src/a.py", "modified")], "fix"),
+        ([("src/a.py", "modified", 30)], "feat"),
+    ],
+)
+def test_detect_commit_type_priority(tmp_path, files, expected):
+    diffs = [
+        FileDiff(path=path, status=status, additions=rest[0] if rest else 1)
+        for path, status, *rest in files
+    ]
+
+    assert _tool(tmp_path)._detect_commit_type(diffs) == expected
+
+
+def test_body_groups_files_by_status(tmp_path):
+    files = [
+        FileDiff(path="new.py", status="added"),
+        FileDiff(path="moved.py", status="renamed"),
+        FileDiff(path="edit.py", status="modified", additions=2, deletions=1),
+        FileDiff(path="old.py", status="deleted"),
+        FileDiff(path="new2.py", status="added"),
+    ]
+
+    assert _tool(tmp_path)._generate_body(files) == (
+        "Added:\n"
+        "  - new.py\n"
+        "  - new2.py\n"
+        "\nModified:\n"
+        "  - edit.py (+2/-1)\n"
+        "\nDeleted:\n"
+        "  - old.py"
+    )
+
+
+_PATCH = (
+    b"diff --git a/one.txt b/one.txt\n"
+    b"--- a/one.txt\n+++ b/one.txt\n@@ -1 +1 @@\n-x\n+" + b"y" * 100 + b"\n"
+    b"diff --git a/two.txt b/two.txt\n"
+    b"--- a/two.txt\n+++ b/two.txt\n@@ -1 +1 @@\n-a\n+b\n"
+)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 13, len(_PATCH)])
+def test_patch_previews_split_streamed_patch(chunk_size):
+    previews = _PatchPreviews(limit=64)
+    for i in range(0, len(_PATCH), chunk_size):
+        previews.feed(_PATCH[i : i + chunk_size])
+
+    result = previews.finish()
+
+    first, second = _PATCH.split(b"\ndiff --git a/two")
+    assert result == {
+        b"a/one.txt b/one.txt": first[:64],
+        b"a/two.txt b/two.txt": (b"diff --git a/two" + second)[:64],
+    }
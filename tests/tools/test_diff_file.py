@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import subprocess
+
+import pytest
+
+from vibe.core.tools.base import ToolError
+from vibe.core.tools.builtins.diff_file import (
+    DiffFile,
+    DiffFileArgs,
+    DiffFileState,
+    DiffFileToolConfig,
+)
+
+
+def _git(root, *args):
+    subprocess.run(["git", *args], cwd=root, capture_output=True, check=True)
+
+
+@pytest.fixture
+def git_repo(tmp_path):
+    _git(tmp_path, "init")
+    _git(tmp_path, "config", "user.email", "test@test.com")
+    _git(tmp_path, "config", "user.name", "Test")
+    (tmp_path / "file.txt").write_text("".join(f"line {i}\n" for i in range(1, 21)))
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-m", "Initial commit")
+    return tmp_path
+
+
+def _tool(workdir):
+    return DiffFile(config=DiffFileToolConfig(workdir=workdir), state=DiffFileState())
+
+
+@pytest.mark.asyncio
+async def test_raises_outside_git_repo(tmp_path):
+    (tmp_path / "file.txt").write_text("x\n")
+
+    with pytest.raises(ToolError):
+        await _tool(tmp_path).run(DiffFileArgs(path="file.txt"))
+
+
+@pytest.mark.asyncio
+async def test_reports_no_changes(git_repo):
+    result = await _tool(git_repo).run(DiffFileArgs(path="file.txt"))
+
+    assert result.has_changes is False
+
+
+@pytest.mark.asyncio
+async def test_counts_changed_lines(git_repo):
+    path = git_repo / "file.txt"
+    lines = path.read_text().splitlines(keepends=True)
+    lines[1] = "--- looks like a header\n"
+    lines[4] = "changed 5\n"
+    del lines[15]
+    path.write_text("".join(lines))
+
+    result = await _tool(git_repo).run(DiffFileArgs(path="file.txt"))
+
+    assert (result.additions, result.deletions) == (2, 3)
+    assert result.summary == "+2/-3 in 2 hunk(s)"
+    first, second = result.hunks
+    assert first.start_line == 1
+    assert first.old_lines == ["line 2", "line 5"]
+    assert first.new_lines == ["--- looks like a header", "changed 5"]
+    assert second.old_lines == ["line 16"]
+    assert second.new_lines == []
+
+
+@pytest.mark.parametrize(
+    ("diff_text", "expected"),
+    [
+        ("", (0, 0)),
+        ("+first\n-second\n", (1, 1)),
+        ("--- a/f\n+++ b/f\n@@ -1 +1 @@\n-old\n+new\n", (1, 1)),
+        ("+++ b/f", (0, 0)),
+    ],
+)
+def test_scan_diff_skips_file_headers(git_repo, diff_text, expected):
+    additions, deletions, _ = _tool(git_repo)._scan_diff(diff_text)
+
+    assert (additions, deletions) == expected
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from vibe.core.tools.dir_cache import DirListingCache
+
+
+def test_lists_entries_sorted_case_insensitively(tmp_path):
+    (tmp_path / "b.txt").write_text("b")
+    (tmp_path / "A.txt").write_text("a")
+    (tmp_path / "sub").mkdir()
+
+    entries = DirListingCache().entries(str(tmp_path))
+
+    assert [e.name for e in entries] == ["A.txt", "b.txt", "sub"]
+    assert [e.is_dir for e in entries] == [False, False, True]
+
+
+def test_reuses_listing_while_mtime_is_unchanged(tmp_path, age_mtime):
+    (tmp_path / "a.txt").write_text("a")
+    age_mtime(tmp_path)
+    cache = DirListingCache()
+
+    first = cache.entries(str(tmp_path))
+    second = cache.entries(str(tmp_path))
+
+    assert second is first
+    assert len(cache) == 1
+
+
+def test_rescans_when_directory_changes(tmp_path, age_mtime):
+    (tmp_path / "a.txt").write_text("a")
+    age_mtime(tmp_path)
+    cache = DirListingCache()
+    cache.entries(str(tmp_path))
+
+    (tmp_path / "b.txt").write_text("b")
+
+    assert [e.name for e in cache.entries(str(tmp_path))] == ["a.txt", "b.txt"]
+
+
+def test_does_not_cache_recently_modified_directories(tmp_path):
+    (tmp_path / "a.txt").write_text("a")
+    cache = DirListingCache()
+
+    cache.entries(str(tmp_path))
+
+    assert len(cache) == 0
+
+
+def test_evicts_least_recently_used_listing(tmp_path, age_mtime):
+    dirs = [tmp_path / name for name in ("one", "two", "three")]
+    for d in dirs:
+        d.mkdir()
+        age_mtime(d)
+    cache = DirListingCache(max_dirs=2)
+
+    for d in dirs:
+        cache.entries(str(d))
+
+    assert len(cache) == 2
+
+
+def test_raises_for_missing_directory(tmp_path):
+    with pytest.raises(OSError):
+        DirListingCache().entries(str(tmp_path / "missing"))
+
+
+def test_counts_entries_without_caching_a_listing(tmp_path, age_mtime):
+    (tmp_path / "a.txt").write_text("a")
+    (tmp_path / "sub").mkdir()
+    age_mtime(tmp_path)
+    cache = DirListingCache()
+
+    assert cache.count(str(tmp_path)) == 2
+    assert len(cache) == 0
+
+    (tmp_path / "b.txt").write_text("b")
+
+    assert cache.count(str(tmp_path)) == 3
+
+
+def test_count_uses_cached_listing(tmp_path, monkeypatch, age_mtime):
+    (tmp_path / "a.txt").write_text("a")
+    age_mtime(tmp_path)
+    cache = DirListingCache()
+    cache.entries(str(tmp_path))
+
+    def fail(path):
+        raise AssertionError("listing was rescanned")
+
+    monkeypatch.setattr(os, "scandir", fail)
+
+    assert cache.count(str(tmp_path)) == 1
@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+import os
+import re
+import shutil
+
 import pytest
 
 from vibe.core.tools.base import ToolError
+from vibe.core.tools.builtins import find_by_name
 from vibe.core.tools.builtins.find_by_name import (
     FindByName,
     FindByNameArgs,
@@ -17,28 +22,38 @@ def find_tool(tmp_path):
     return FindByName(config=config, state=FindByNameState())
 
 
-@pytest.fixture
-def project_structure(tmp_path):
-    (tmp_path / "main.py").write_text("print('main')")
-    (tmp_path / "utils.py").write_text("print('utils')")
-    (tmp_path / "test_main.py").write_text("print('test')")
-    (tmp_path / "README.md").write_text("# Readme")
-    (tmp_path / "config.json").write_text("{}")
-
-    src = tmp_path / "src"
+@pytest.fixture(scope="session")
+def project_template(tmp_path_factory):
+    root = tmp_path_factory.mktemp("project")
+    (root / "main.py").write_text("print('main')")
+    (root / "utils.py").write_text("print('utils')")
+    (root / "test_main.py").write_text("print('test')")
+    (root / "README.md").write_text("# Readme")
+    (root / "config.json").write_text("{}")
+
+    src = root / "src"
     src.mkdir()
     (src / "app.py").write_text("print('app')")
     (src / "helpers.py").write_text("print('helpers')")
 
-    tests = tmp_path / "tests"
+    tests = root / "tests"
     tests.mkdir()
     (tests / "test_app.py").write_text("print('test_app')")
 
-    (tmp_path / ".git").mkdir()
-    (tmp_path / ".git" / "config").write_text("git config")
+    (root / ".git").mkdir()
+    (root / ".git" / "config").write_text("git config")
+
+    (root / ".hidden.py").write_text("hidden")
+
+    return root
 
-    (tmp_path / ".hidden.py").write_text("hidden")
 
+@pytest.fixture
+def project_structure(tmp_path, project_template):
+    # Tests only read the tree, so hardlinks are enough for an isolated copy.
+    shutil.copytree(
+        project_template, tmp_path, dirs_exist_ok=True, copy_function=os.link
+    )
     return tmp_path
 
 
@@ -71,6 +86,19 @@ async def test_finds_test_files(tmp_path, project_structure):
     assert "main.py" not in names
 
 
+@pytest.mark.asyncio
+async def test_supports_character_classes(tmp_path, project_structure):
+    config = FindByNameToolConfig(workdir=tmp_path)
+    tool = FindByName(config=config, state=FindByNameState())
+
+    result = await tool.run(
+        FindByNameArgs(pattern="[mu]*.py", path=str(project_structure))
+    )
+
+    names = sorted(m.name for m in result.matches)
+    assert names == ["main.py", "utils.py"]
+
+
 @pytest.mark.asyncio
 async def test_excludes_git_directory(tmp_path, project_structure):
     config = FindByNameToolConfig(workdir=tmp_path)
@@ -82,6 +110,69 @@ async def test_excludes_git_directory(tmp_path, project_structure):
     assert not any(".git" in p for p in paths)
 
 
+@pytest.mark.asyncio
+async def test_applies_name_and_glob_excludes(tmp_path):
+    (tmp_path / "node_modules").mkdir()
+    (tmp_path / "node_modules" / "dep.js").write_text("")
+    (tmp_path / "app.js").write_text("")
+    (tmp_path / "app.pyc").write_text("")
+
+    config = FindByNameToolConfig(workdir=tmp_path)
+    tool = FindByName(config=config, state=FindByNameState())
+
+    result = await tool.run(FindByNameArgs(pattern="*", path=str(tmp_path)))
+
+    assert [m.name for m in result.matches] == ["app.js"]
+
+
+@pytest.mark.asyncio
+async def test_applies_several_glob_excludes(tmp_path):
+    for name in ("a.txt", "c.txt", "run.log", "build1", "builds", "keep.md"):
+        (tmp_path / name).write_text("")
+
+    config = FindByNameToolConfig(
+        workdir=tmp_path, default_excludes=["*.log", "build?", "[ab].txt"]
+    )
+    tool = FindByName(config=config, state=FindByNameState())
+
+    result = await tool.run(FindByNameArgs(pattern="*", path=str(tmp_path)))
+
+    assert [m.name for m in result.matches] == ["c.txt", "keep.md"]
+
+
+@pytest.fixture
+def case_insensitive_paths(monkeypatch):
+    # Stands in for Windows, where fnmatch matches names case-insensitively.
+    monkeypatch.setattr(find_by_name, "_IGNORE_CASE", True)
+    monkeypatch.setattr(find_by_name, "_GLOB_FLAGS", re.IGNORECASE)
+    find_by_name._compile_glob.cache_clear()
+    yield
+    find_by_name._compile_glob.cache_clear()
+
+
+@pytest.mark.asyncio
+async def test_matches_names_case_insensitively_where_paths_are(
+    tmp_path, case_insensitive_paths
+):
+    for name in ("README.md", "Main.PY", "Build.LOG"):
+        (tmp_path / name).write_text("")
+    (tmp_path / "Node_Modules").mkdir()
+    (tmp_path / "Node_Modules" / "dep.py").write_text("")
+
+    config = FindByNameToolConfig(
+        workdir=tmp_path, default_excludes=["node_modules", "*.log"]
+    )
+    tool = FindByName(config=config, state=FindByNameState())
+
+    async def names(pattern: str) -> list[str]:
+        result = await tool.run(FindByNameArgs(pattern=pattern, path=str(tmp_path)))
+        return [m.name for m in result.matches]
+
+    assert await names("readme.md") == ["README.md"]
+    assert await names("*.py") == ["Main.PY"]
+    assert await names("*") == ["Main.PY", "README.md"]
+
+
 @pytest.mark.asyncio
 async def test_excludes_hidden_files_by_default(tmp_path, project_structure):
     config = FindByNameToolConfig(workdir=tmp_path)
@@ -161,6 +252,21 @@ async def test_truncates_when_exceeds_max_results(tmp_path):
     assert result.was_truncated is True
 
 
+@pytest.mark.asyncio
+async def test_not_truncated_when_only_non_matches_remain(tmp_path):
+    for i in range(5):
+        (tmp_path / f"file{i}.py").write_text(f"print({i})")
+    (tmp_path / "notes.txt").write_text("notes")
+
+    config = FindByNameToolConfig(workdir=tmp_path, max_results=5)
+    tool = FindByName(config=config, state=FindByNameState())
+
+    result = await tool.run(FindByNameArgs(pattern="*.py", path=str(tmp_path)))
+
+    assert len(result.matches) == 5
+    assert result.was_truncated is False
+
+
 @pytest.mark.asyncio
 async def test_raises_error_for_nonexistent_path(find_tool):
     with pytest.raises(ToolError) as err:
@@ -195,6 +301,36 @@ async def test_returns_relative_paths(tmp_path, project_structure):
     assert result.matches[0].path == "src/app.py"
 
 
+@pytest.mark.asyncio
+async def test_finds_literal_relative_path(tmp_path, project_structure):
+    config = FindByNameToolConfig(workdir=project_structure)
+    tool = FindByName(config=config, state=FindByNameState())
+
+    result = await tool.run(
+        FindByNameArgs(pattern="src/app.py", path=str(project_structure))
+    )
+
+    assert [m.path for m in result.matches] == ["src/app.py"]
+    assert result.matches[0].size == len("print('app')")
+
+
+@pytest.mark.asyncio
+async def test_literal_path_respects_filters(tmp_path, project_structure):
+    config = FindByNameToolConfig(workdir=project_structure)
+    tool = FindByName(config=config, state=FindByNameState())
+
+    for args in (
+        FindByNameArgs(pattern=".git/config", path=str(project_structure)),
+        FindByNameArgs(pattern="src/app.py", path=str(project_structure), max_depth=0),
+        FindByNameArgs(pattern="../outside.py", path=str(project_structure / "src")),
+        FindByNameArgs(
+            pattern="src/app.py", path=str(project_structure), file_type="directory"
+        ),
+    ):
+        result = await tool.run(args)
+        assert result.matches == []
+
+
 @pytest.mark.asyncio
 async def test_includes_file_sizes(tmp_path, project_structure):
     config = FindByNameToolConfig(workdir=tmp_path)
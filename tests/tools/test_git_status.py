@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 import pytest
-import pytest_asyncio
 
 from vibe.core.tools.builtins.git_status import (
+    GitFileStatus,
     GitStatus,
     GitStatusArgs,
+    GitStatusResult,
     GitStatusState,
     GitStatusToolConfig,
 )
@@ -17,27 +18,31 @@ def git_tool(tmp_path):
     return GitStatus(config=config, state=GitStatusState())
 
 
-@pytest_asyncio.fixture
-async def git_repo(tmp_path):
-    import asyncio
+@pytest.fixture(scope="session")
+def git_repo_template(tmp_path_factory):
+    import subprocess
+
+    root = tmp_path_factory.mktemp("git_template")
+
+    def run(*args):
+        subprocess.run(args, cwd=root, capture_output=True, check=False)
+
+    run("git", "init")
+    run("git", "config", "user.email", "test@test.com")
+    run("git", "config", "user.name", "Test")
 
-    async def run(*args):
-        proc = await asyncio.create_subprocess_exec(
-            *args,
-            cwd=tmp_path,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        await proc.communicate()
+    (root / "file.txt").write_text("content")
+    run("git", "add", "file.txt")
+    run("git", "commit", "-m", "Initial commit")
 
-    await run("git", "init")
-    await run("git", "config", "user.email", "test@test.com")
-    await run("git", "config", "user.name", "Test")
+    return root
 
-    (tmp_path / "file.txt").write_text("content")
-    await run("git", "add", "file.txt")
-    await run("git", "commit", "-m", "Initial commit")
 
+@pytest.fixture
+def git_repo(tmp_path, git_repo_template):
+    import shutil
+
+    shutil.copytree(git_repo_template, tmp_path, dirs_exist_ok=True)
     return tmp_path
 
 
@@ -150,6 +155,72 @@ async def test_generates_summary_with_changes(tmp_path, git_repo):
     assert "modified" in result.summary.lower() or "untracked" in result.summary.lower()
 
 
+@pytest.mark.asyncio
+async def test_reports_staged_rename_and_stash(git_repo):
+    import subprocess
+
+    def run(*args):
+        subprocess.run(args, cwd=git_repo, capture_output=True, check=True)
+
+    (git_repo / "file.txt").write_text("stashed")
+    run("git", "stash")
+    run("git", "mv", "file.txt", "new name.txt")
+
+    config = GitStatusToolConfig(workdir=git_repo)
+    tool = GitStatus(config=config, state=GitStatusState())
+
+    result = await tool.run(GitStatusArgs(show_stash=True))
+
+    assert [(f.path, f.status) for f in result.staged] == [("new name.txt", "renamed")]
+    assert result.unstaged == []
+    assert result.stash_count == 1
+    assert result.has_conflicts is False
+
+
+@pytest.mark.asyncio
+async def test_stops_reading_after_max_untracked_files(git_repo):
+    (git_repo / "file.txt").write_text("modified")
+    for i in range(20):
+        (git_repo / f"new{i:02}.txt").write_text("new")
+
+    config = GitStatusToolConfig(workdir=git_repo, max_files=3)
+    tool = GitStatus(config=config, state=GitStatusState())
+
+    result = await tool.run(GitStatusArgs())
+
+    assert result.untracked == ["new00.txt", "new01.txt", "new02.txt"]
+    assert [f.path for f in result.unstaged] == ["file.txt"]
+
+
+def test_parses_porcelain_v2_records(git_tool):
+    output = "\0".join([
+        "# branch.oid 0123abc",
+        "# branch.head feature",
+        "# branch.upstream origin/feature",
+        "# branch.ab +2 -1",
+        "1 AM N... 000000 100644 100644 0000 1111 added then edited.txt",
+        "1 .D N... 100644 100644 000000 2222 2222 gone.txt",
+        "u UU N... 100644 100644 100644 100644 3333 4444 5555 both.txt",
+        "? new.txt",
+        "",
+    ])
+
+    status = git_tool._parse_porcelain_v2(output)
+
+    assert (status.branch, status.ahead, status.behind) == ("feature", 2, 1)
+    assert [(f.path, f.status) for f in status.staged] == [
+        ("added then edited.txt", "added"),
+        ("both.txt", "conflict"),
+    ]
+    assert [(f.path, f.status) for f in status.unstaged] == [
+        ("added then edited.txt", "modified"),
+        ("gone.txt", "deleted"),
+        ("both.txt", "conflict"),
+    ]
+    assert status.untracked == ["new.txt"]
+    assert status.has_conflicts is True
+
+
 def test_get_call_display():
     from vibe.core.types import ToolCallEvent
 
@@ -160,3 +231,36 @@ def test_get_call_display():
 
     display = GitStatus.get_call_display(event)
     assert "git_status" in display.summary
+
+
+def test_get_result_display_caps_each_section():
+    from vibe.core.types import ToolResultEvent
+
+    result = GitStatusResult(
+        is_git_repo=True,
+        branch="main",
+        staged=[GitFileStatus(path="a.py", status="added", staged=True)],
+        unstaged=[GitFileStatus(path=f"m{i}.py", status="modified") for i in range(12)],
+        untracked=[f"u{i}.txt" for i in range(7)],
+        summary="On branch main",
+    )
+    event = ToolResultEvent(
+        tool_name="git_status", tool_class=GitStatus, result=result, tool_call_id="t"
+    )
+
+    output = GitStatus.get_result_display(event).details["output"]
+
+    assert output.splitlines() == [
+        "🌿 On branch main",
+        "",
+        "📦 Staged:",
+        "  ➕ a.py",
+        "",
+        "📝 Unstaged:",
+        *[f"  ✏️ m{i}.py" for i in range(10)],
+        "  ... and 2 more",
+        "",
+        "❓ Untracked:",
+        *[f"  • u{i}.txt" for i in range(5)],
+        "  ... and 2 more",
+    ]
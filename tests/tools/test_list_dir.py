@@ -152,3 +152,8 @@ def test_format_size():
     assert ListDir._format_size(1024) == "1.0KB"
     assert ListDir._format_size(1024 * 1024) == "1.0MB"
     assert ListDir._format_size(1024 * 1024 * 1024) == "1.0GB"
+    assert ListDir._format_size(0) == "0B"
+    assert ListDir._format_size(1023) == "1023B"
+    assert ListDir._format_size(1536) == "1.5KB"
+    assert ListDir._format_size(1024**4) == "1.0TB"
+    assert ListDir._format_size(2 * 1024**5) == "2048.0TB"
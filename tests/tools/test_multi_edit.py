@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 from pathlib import Path
 
 import pytest
@@ -8,6 +9,7 @@ from vibe.core.tools.builtins.multi_edit import (
     DiffGenerator,
     EditBlock,
     FileEdit,
+    MatchContext,
     MatchingEngine,
     MatchTier,
     MultiEdit,
@@ -81,6 +83,17 @@ class TestMatchingEngine:
 
         assert result.tier in [MatchTier.EXACT, MatchTier.NORMALIZED]
 
+    def test_tier2_skips_partial_candidates(self):
+        content = "if x:\n    pass\nif x:\n    return 1\n"
+        edit = EditBlock(search="if x:\n  return 1", replace="if x:\n  return 2")
+
+        result = MatchingEngine.match(content, edit)
+
+        assert result.tier == MatchTier.NORMALIZED
+        assert content[result.match_start : result.match_end] == (
+            "if x:\n    return 1\n"
+        )
+
     def test_tier3_anchored_match(self):
         content = """def foo():
     # anchor before
@@ -99,6 +112,22 @@ class TestMatchingEngine:
         assert result.success
         assert result.tier in [MatchTier.EXACT, MatchTier.ANCHORED]
 
+    def test_tier3_picks_occurrence_between_anchors(self):
+        content = "# a\nx = 1\n# b\n  # c  \n\nx = 1\n# d\n"
+        edit = EditBlock(
+            search="x = 1", replace="x = 2", context_before="# c", context_after="# d"
+        )
+
+        result = MatchingEngine._tier3_anchored(MatchContext(content, 0.85), edit)
+
+        assert result.success
+        assert result.match_start == content.rindex("x = 1")
+
+        edit = EditBlock(search="x = 1", replace="x = 2", context_before="# b")
+        result = MatchingEngine._tier3_anchored(MatchContext(content, 0.85), edit)
+
+        assert not result.success
+
     def test_tier4_line_range_match(self):
         content = """line 1
 line 2
@@ -114,6 +143,20 @@ line 5
 
         assert result.success
 
+    def test_tier4_line_range_offsets_and_inverted_range(self):
+        content = "a = 1\nb = 2\nc = 3\nb = 2\n"
+        edit = EditBlock(search="b = 2", replace="x", line_start=3, line_end=4)
+
+        result = MatchingEngine._tier4_line_range(MatchContext(content, 0.85), edit)
+
+        assert result.success
+        assert (result.match_start, result.match_end) == (18, 23)
+
+        inverted = EditBlock(search="b = 2", replace="x", line_start=9, line_end=2)
+        result = MatchingEngine._tier4_line_range(MatchContext(content, 0.85), inverted)
+
+        assert not result.success
+
     def test_tier5_fuzzy_no_auto_apply(self):
         content = "Hello World"
         edit = EditBlock(search="Hello World", replace="Hi Universe")  # Typo
@@ -123,6 +166,38 @@ line 5
         if result.tier == MatchTier.FUZZY:
             assert not result.success
 
+    def test_tier5_fuzzy_suggests_closest_window(self):
+        content = "def alpha():\n    return compute_total(items)\n\ndef beta():\n"
+        edit = EditBlock(search="return compute_totl(items)", replace="pass")
+
+        result = MatchingEngine.match(content, edit)
+
+        assert result.tier == MatchTier.FUZZY
+        assert not result.success
+        assert result.confidence >= 0.9
+        assert result.suggestion is not None
+        assert result.suggestion == content[result.match_start : result.match_end]
+        assert "compute_total" in result.suggestion
+
+    def test_tier5_reports_failure_below_threshold(self):
+        edit = EditBlock(search="completely unrelated text", replace="x")
+
+        result = MatchingEngine.match("def alpha():\n    pass\n", edit)
+
+        assert result.tier == MatchTier.FAILED
+        assert result.confidence == 0.0
+
+    def test_match_in_reuses_context_line_tables(self):
+        ctx = MatchContext("def f():\n    x = 1\n    y = 2\n", 0.85)
+
+        first = MatchingEngine.match_in(ctx, EditBlock(search="x  =  1", replace=""))
+        lines = ctx.lines
+        second = MatchingEngine.match_in(ctx, EditBlock(search="y = 2  ", replace=""))
+
+        assert not first.success
+        assert second.tier == MatchTier.NORMALIZED
+        assert ctx.lines is lines
+
 
 class TestMultiEdit:
     @pytest.mark.asyncio
@@ -173,6 +248,29 @@ class TestMultiEdit:
 
         assert "DEBUG = False" in config_file.read_text()
 
+    @pytest.mark.asyncio
+    async def test_apply_replaces_file_atomically(self, tmp_path, config_file):
+        config_file.chmod(0o640)
+        config = MultiEditConfig(workdir=tmp_path)
+        tool = MultiEdit(config=config, state=MultiEditState())
+
+        args = MultiEditArgs(
+            files=[
+                FileEdit(
+                    path=str(config_file),
+                    edits=[EditBlock(search="DEBUG = True", replace="DEBUG = False")],
+                )
+            ],
+            dry_run=False,
+            create_backup=False,
+        )
+
+        result = await tool.run(args)
+
+        assert result.success
+        assert config_file.stat().st_mode & 0o777 == 0o640
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["config.py"]
+
     @pytest.mark.asyncio
     async def test_multiple_edits_single_file(self, tmp_path, config_file):
         config = MultiEditConfig(workdir=tmp_path)
@@ -262,6 +360,65 @@ class TestMultiEdit:
         assert not result.success
         assert result.state == "rolled_back"
 
+    @pytest.mark.asyncio
+    async def test_fail_fast_leaves_other_files_untouched(self, tmp_path):
+        file1 = tmp_path / "file1.py"
+        file2 = tmp_path / "file2.py"
+        file1.write_text("VERSION = 1")
+        file2.write_text("VERSION = 1")
+
+        config = MultiEditConfig(workdir=tmp_path)
+        tool = MultiEdit(config=config, state=MultiEditState())
+
+        args = MultiEditArgs(
+            files=[
+                FileEdit(
+                    path=str(file1),
+                    edits=[EditBlock(search="VERSION = 1", replace="VERSION = 2")],
+                ),
+                FileEdit(
+                    path=str(file2),
+                    edits=[EditBlock(search="NONEXISTENT", replace="FAIL")],
+                ),
+            ],
+            dry_run=False,
+            fail_fast=True,
+        )
+
+        result = await tool.run(args)
+
+        assert result.state == "rolled_back"
+        assert result.files_checked == 2
+        assert file1.read_text() == "VERSION = 1"
+        assert not (tmp_path / "file1.py.bak").exists()
+
+    @pytest.mark.asyncio
+    async def test_repeated_file_entries_apply_in_order(self, tmp_path):
+        file1 = tmp_path / "file1.py"
+        file1.write_text("VERSION = 1")
+
+        config = MultiEditConfig(workdir=tmp_path)
+        tool = MultiEdit(config=config, state=MultiEditState())
+
+        args = MultiEditArgs(
+            files=[
+                FileEdit(
+                    path=str(file1),
+                    edits=[EditBlock(search="VERSION = 1", replace="VERSION = 2")],
+                ),
+                FileEdit(
+                    path="file1.py",
+                    edits=[EditBlock(search="VERSION = 2", replace="VERSION = 3")],
+                ),
+            ],
+            dry_run=False,
+        )
+
+        result = await tool.run(args)
+
+        assert result.success
+        assert file1.read_text() == "VERSION = 3"
+
     @pytest.mark.asyncio
     async def test_creates_backup(self, tmp_path, config_file):
         config = MultiEditConfig(workdir=tmp_path)
@@ -288,6 +445,61 @@ class TestMultiEdit:
         backup_path = Path(list(result.backup_paths.values())[0])
         assert backup_path.exists()
         assert backup_path.read_text() == original_content
+        assert "DEBUG = False" in config_file.read_text()
+
+    @pytest.mark.asyncio
+    async def test_backup_replaces_stale_backup(self, tmp_path, config_file):
+        stale = tmp_path / "config.py.bak"
+        stale.write_text("stale")
+        original_content = config_file.read_text()
+
+        config = MultiEditConfig(workdir=tmp_path)
+        tool = MultiEdit(config=config, state=MultiEditState())
+
+        args = MultiEditArgs(
+            files=[
+                FileEdit(
+                    path=str(config_file),
+                    edits=[EditBlock(search="DEBUG = True", replace="DEBUG = False")],
+                )
+            ],
+            dry_run=False,
+            create_backup=True,
+        )
+
+        result = await tool.run(args)
+
+        assert result.success
+        assert stale.read_text() == original_content
+
+    @pytest.mark.asyncio
+    async def test_hard_linked_file_is_edited_in_place(self, tmp_path, config_file):
+        link = tmp_path / "config_link.py"
+        link.hardlink_to(config_file)
+        original_content = config_file.read_text()
+
+        config = MultiEditConfig(workdir=tmp_path)
+        tool = MultiEdit(config=config, state=MultiEditState())
+
+        args = MultiEditArgs(
+            files=[
+                FileEdit(
+                    path=str(config_file),
+                    edits=[EditBlock(search="DEBUG = True", replace="DEBUG = False")],
+                )
+            ],
+            dry_run=False,
+            create_backup=True,
+        )
+
+        result = await tool.run(args)
+
+        assert result.success
+        assert "DEBUG = False" in link.read_text()
+        assert config_file.stat().st_ino == link.stat().st_ino
+        assert result.backup_paths
+        backup_path = Path(next(iter(result.backup_paths.values())))
+        assert backup_path.read_text() == original_content
 
     @pytest.mark.asyncio
     async def test_hash_conflict_detection(self, tmp_path, config_file):
@@ -310,6 +522,29 @@ class TestMultiEdit:
         assert not result.success
         assert "hash mismatch" in result.results[0].errors[0].lower()
 
+    @pytest.mark.asyncio
+    async def test_matching_hash_applies(self, tmp_path, config_file):
+        expected = hashlib.md5(config_file.read_bytes()).hexdigest()
+
+        config = MultiEditConfig(workdir=tmp_path)
+        tool = MultiEdit(config=config, state=MultiEditState())
+
+        args = MultiEditArgs(
+            files=[
+                FileEdit(
+                    path=str(config_file),
+                    edits=[EditBlock(search="DEBUG = True", replace="DEBUG = False")],
+                    expected_hash=expected,
+                )
+            ],
+            dry_run=False,
+        )
+
+        result = await tool.run(args)
+
+        assert result.success
+        assert "DEBUG = False" in config_file.read_text()
+
     @pytest.mark.asyncio
     async def test_file_not_found(self, tmp_path):
         config = MultiEditConfig(workdir=tmp_path)
@@ -393,6 +628,26 @@ class TestSafetyChecker:
         assert not passed
         assert any("merge" in e.lower() for e in errors)
 
+    @pytest.mark.asyncio
+    async def test_detects_rebase_and_index_lock(self, tmp_path):
+        git_dir = tmp_path / ".git"
+        (git_dir / "rebase-merge").mkdir(parents=True)
+        (git_dir / "index.lock").write_text("")
+
+        passed, errors = await SafetyChecker.check_all(tmp_path)
+
+        assert not passed
+        assert len(errors) == 2
+
+    @pytest.mark.asyncio
+    async def test_passes_when_git_is_a_file(self, tmp_path):
+        (tmp_path / ".git").write_text("gitdir: /elsewhere")
+
+        passed, errors = await SafetyChecker.check_all(tmp_path)
+
+        assert passed
+        assert errors == []
+
 
 class TestDiffGenerator:
     """Tests for diff generation."""
@@ -408,6 +663,25 @@ class TestDiffGenerator:
         assert "-line2" in diff
         assert "+modified" in diff
 
+    @pytest.mark.parametrize("changed", [0, 2, 50, 97, 99])
+    def test_matches_difflib_around_a_single_change(self, changed):
+        import difflib
+
+        orig_lines = [f"line {i}\n" for i in range(100)]
+        mod_lines = list(orig_lines)
+        mod_lines[changed] = "changed\n"
+        mod_lines.insert(changed + 1, "inserted\n")
+        original, modified = "".join(orig_lines), "".join(mod_lines)
+
+        diff = DiffGenerator.generate(original, modified, "test.py")
+
+        expected = "".join(
+            difflib.unified_diff(
+                orig_lines, mod_lines, fromfile="a/test.py", tofile="b/test.py"
+            )
+        )
+        assert diff == expected
+
 
 def test_get_call_display():
     from vibe.core.types import ToolCallEvent
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+
+import pytest
+
+from vibe.core.tools.base import ToolError
+from vibe.core.tools.builtins.test_run import (
+    TestRun,
+    TestRunArgs,
+    TestRunState,
+    TestRunToolConfig,
+)
+
+VERBOSE_OUTPUT = """\
+============================= test session starts ==============================
+tests/test_a.py::test_one PASSED                                         [ 25%]
+tests/test_a.py::test_two FAILED                                         [ 50%]
+tests/test_a.py::TestGroup::test_three SKIPPED                           [ 75%]
+tests/test_b.py::test_four ERROR                                         [100%]
+=========== 1 failed, 1 passed, 1 skipped, 1 error in 0.12s ===========
+"""
+
+
+@pytest.fixture
+def test_run_tool(tmp_path):
+    config = TestRunToolConfig(workdir=tmp_path)
+    return TestRun(config=config, state=TestRunState())
+
+
+def test_parse_output_reads_test_lines_and_summary(test_run_tool):
+    result = test_run_tool._parse_output(VERBOSE_OUTPUT, "", 1, 0.12, max_tests=50)
+
+    assert [t.name for t in result.tests] == [
+        "tests/test_a.py::test_one",
+        "tests/test_a.py::test_two",
+        "tests/test_a.py::TestGroup::test_three",
+        "tests/test_b.py::test_four",
+    ]
+    assert [t.status for t in result.failed_tests] == ["failed", "error"]
+    assert (result.passed, result.failed, result.skipped, result.errors) == (1, 1, 1, 1)
+    assert not result.success
+
+
+def test_parse_output_caps_listed_tests(test_run_tool):
+    result = test_run_tool._parse_output(VERBOSE_OUTPUT, "", 1, 0.12, max_tests=2)
+
+    assert len(result.tests) == 2
+
+
+def test_parse_summary_without_failures(test_run_tool):
+    stdout = "===== 3 passed, 2 skipped in 0.50s =====\n"
+
+    assert test_run_tool._parse_summary(stdout) == {"passed": 3, "skipped": 2}
+    assert test_run_tool._parse_summary("no summary here") is None
+
+
+def test_parse_summary_reads_every_count_from_last_summary_line(test_run_tool):
+    stdout = (
+        "===== 9 passed in 0.10s =====\n"
+        "==== 1 failed, 5 passed, 2 skipped, 3 deselected, 1 xfailed, 2 errors "
+        "in 148.97s (0:02:28) ====\n"
+    )
+
+    assert test_run_tool._parse_summary(stdout) == {
+        "failed": 1,
+        "passed": 5,
+        "skipped": 2,
+        "errors": 2,
+    }
+
+
+def test_parse_output_reads_xdist_test_lines(test_run_tool):
+    stdout = (
+        "[gw0] [ 50%] PASSED tests/test_a.py::test_one \n"
+        "[gw1] [100%] FAILED tests/test_a.py::TestGroup::test_two \n"
+        "FAILED tests/test_a.py::TestGroup::test_two - assert 0\n"
+        "=========== 1 failed, 1 passed in 0.40s ===========\n"
+    )
+
+    result = test_run_tool._parse_output(stdout, "", 1, 0.4, max_tests=50)
+
+    assert [(t.name, t.status) for t in result.tests] == [
+        ("tests/test_a.py::test_one", "passed"),
+        ("tests/test_a.py::TestGroup::test_two", "failed"),
+    ]
+
+
+def test_build_command_uses_workers_unless_fail_fast(tmp_path):
+    tool = TestRun(
+        config=TestRunToolConfig(workdir=tmp_path, workers="auto"), state=TestRunState()
+    )
+
+    cmd = tool._build_command(TestRunArgs(), tmp_path)
+    assert cmd[cmd.index("-n") + 1] == "auto"
+
+    cmd = tool._build_command(TestRunArgs(fail_fast=True), tmp_path)
+    assert "-n" not in cmd
+
+
+@pytest.mark.asyncio
+async def test_read_bounded_keeps_head_and_last_line():
+    stream = asyncio.StreamReader()
+    stream.feed_data(b"".join(f"line {i}\n".encode() for i in range(1000)))
+    stream.feed_data(b"=== 3 passed in 0.10s ===\n")
+    stream.feed_eof()
+
+    head, last_line = await TestRun._read_bounded(stream, 14)
+
+    assert head == b"line 0\nline 1\n"
+    assert last_line == b"=== 3 passed in 0.10s ==="
+
+    stream = asyncio.StreamReader()
+    stream.feed_data(b"short\n")
+    stream.feed_eof()
+
+    assert await TestRun._read_bounded(stream, 14) == (b"short\n", b"")
+
+
+def test_cap_output_counts_characters_and_keeps_summary():
+    head = "é" * 6 + "\n=== 1 passed in 0.01s ==="
+
+    assert TestRun._cap_output(head.encode(), b"", 4) == (
+        "éééé\n=== 1 passed in 0.01s ==="
+    )
+    assert TestRun._cap_output(b"\xc3\xa9" * 4, b"", 4) == "éééé"
+    assert TestRun._cap_output(b"short", b"=== end ===", 100) == "short\n=== end ==="
+
+
+def test_parse_output_reports_no_tests_collected(test_run_tool):
+    stdout = "collected 0 items\n\n============ no tests ran in 0.01s ============\n"
+
+    result = test_run_tool._parse_output(stdout, "", 5, 0.01, max_tests=50)
+
+    assert not result.success
+    assert result.total == 0
+    assert result.summary == "❌ pytest: no tests collected in 0.0s"
+    assert result.output == stdout
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX process groups")
+@pytest.mark.asyncio
+async def test_timeout_kills_children_after_pytest_exits(tmp_path):
+    # The leader exits at once while its child keeps the stdout pipe open and
+    # appends to a heartbeat file until it is killed.
+    heartbeat = tmp_path / "heartbeat"
+    child = (
+        "import time\n"
+        "while True:\n"
+        f"    open({str(heartbeat)!r}, 'a').write('.')\n"
+        "    time.sleep(0.05)\n"
+    )
+    leader = (
+        f"import subprocess, sys; subprocess.Popen([sys.executable, '-c', {child!r}])"
+    )
+    # The read deadline is the configured timeout plus 10s.
+    tool = TestRun(
+        config=TestRunToolConfig(workdir=tmp_path, timeout=-9), state=TestRunState()
+    )
+
+    with pytest.raises(ToolError, match="timed out"):
+        await tool._run_pytest([sys.executable, "-c", leader])
+
+    beats = heartbeat.read_text()
+    await asyncio.sleep(0.3)
+    assert heartbeat.read_text() == beats
@@ -60,7 +60,7 @@ async def test_parses_python_file(tmp_path, python_file):
     result = await tool.run(ViewFileOutlineArgs(path=str(python_file)))
 
     assert result.language == "python"
-    assert result.total_lines > 0
+    assert result.total_lines == len(python_file.read_text().splitlines())
     assert len(result.symbols) >= 4
 
 
@@ -127,6 +127,23 @@ async def test_includes_docstrings(tmp_path, python_file):
     assert hello_func.docstring == "Say hello."
 
 
+@pytest.mark.asyncio
+async def test_skips_docstrings_when_disabled(outline_tool, python_file, monkeypatch):
+    def fail(*_args):
+        raise AssertionError("docstring extracted although include_docstrings=False")
+
+    monkeypatch.setattr(ViewFileOutline, "_ts_docstring", fail)
+    monkeypatch.setattr(
+        "vibe.core.tools.builtins.view_file_outline.ast.get_docstring", fail
+    )
+
+    result = await outline_tool.run(
+        ViewFileOutlineArgs(path=str(python_file), include_docstrings=False)
+    )
+
+    assert all(s.docstring is None for s in result.symbols)
+
+
 @pytest.mark.asyncio
 async def test_includes_line_numbers(tmp_path, python_file):
     config = ViewFileOutlineToolConfig(workdir=tmp_path)
@@ -150,6 +167,34 @@ async def test_respects_max_depth(tmp_path, python_file):
     assert len(calc_class.children) == 0
 
 
+@pytest.mark.parametrize("tree_sitter", [True, False])
+@pytest.mark.asyncio
+async def test_prunes_nested_classes_at_max_depth(
+    outline_tool, tmp_path, monkeypatch, tree_sitter
+):
+    monkeypatch.setattr(
+        "vibe.core.tools.builtins.view_file_outline.HAS_TREE_SITTER", tree_sitter
+    )
+    nested = tmp_path / "nested.py"
+    nested.write_text(
+        "class Outer:\n"
+        "    class Inner:\n"
+        "        class Innermost:\n"
+        "            def deep(self):\n"
+        "                pass\n"
+    )
+
+    shallow = await outline_tool.run(ViewFileOutlineArgs(path=str(nested)))
+    deep = await outline_tool.run(ViewFileOutlineArgs(path=str(nested), max_depth=4))
+
+    (inner,) = shallow.symbols[0].children
+    assert inner.name == "Inner"
+    assert inner.children == []
+    (innermost,) = deep.symbols[0].children[0].children
+    assert [s.name for s in innermost.children] == ["deep"]
+    assert innermost.children[0].type == "method"
+
+
 @pytest.mark.asyncio
 async def test_generates_summary(tmp_path, python_file):
     config = ViewFileOutlineToolConfig(workdir=tmp_path)
@@ -204,3 +249,162 @@ async def test_handles_class_inheritance(tmp_path, python_file):
     adv_class = next(s for s in result.symbols if s.name == "AdvancedCalc")
     assert adv_class.signature is not None
     assert "Calculator" in adv_class.signature
+
+
+def test_tree_sitter_outline_matches_ast(tmp_path, python_file):
+    pytest.importorskip("tree_sitter_python")
+    source = python_file.read_bytes()
+    extra = b"""
+
+@decorator
+def decorated(a, /, b: int, *args: int, c: int = 1) -> None:
+    def nested():
+        pass
+    # trailing comment
+
+
+if TYPE_CHECKING:
+    def hidden():
+        pass
+
+
+def mapping(m: dict[str, int]) -> None:
+    pass
+"""
+    python_file.write_bytes(source + extra)
+    tool = ViewFileOutline(
+        config=ViewFileOutlineToolConfig(workdir=tmp_path), state=ViewFileOutlineState()
+    )
+
+    for max_depth in (1, 2):
+        expected = tool._parse_python(python_file.read_text(), True, max_depth)
+        tree = tool.state.tree_cache.parse("example", python_file.read_bytes())
+        actual = tool._parse_python_tree_sitter(tree, True, max_depth)
+        assert actual is not None
+        assert actual[-1].signature == "def mapping(m: dict[str, int]) -> None"
+        assert actual == expected
+
+    symbols = tool._parse_python(python_file.read_text(), True, 2)
+    decorated = next(s for s in symbols if s.name == "decorated")
+    assert decorated.signature == "def decorated(b: int) -> None"
+    assert decorated.line_end == decorated.line_start + 2
+
+
+@pytest.mark.asyncio
+async def test_falls_back_to_ast_without_tree_sitter(
+    tmp_path, python_file, monkeypatch
+):
+    from vibe.core.tools.builtins import view_file_outline
+
+    monkeypatch.setattr(view_file_outline, "HAS_TREE_SITTER", False)
+    tool = ViewFileOutline(
+        config=ViewFileOutlineToolConfig(workdir=tmp_path), state=ViewFileOutlineState()
+    )
+
+    result = await tool.run(ViewFileOutlineArgs(path=str(python_file)))
+
+    calc_class = next(s for s in result.symbols if s.name == "Calculator")
+    assert [c.name for c in calc_class.children] == ["__init__", "add", "async_method"]
+
+
+@pytest.mark.asyncio
+async def test_reuses_outline_for_unchanged_file(outline_tool, python_file, age_mtime):
+    age_mtime(python_file)
+
+    first = await outline_tool.run(ViewFileOutlineArgs(path=str(python_file)))
+    second = await outline_tool.run(ViewFileOutlineArgs(path=str(python_file)))
+    shallow = await outline_tool.run(
+        ViewFileOutlineArgs(path=str(python_file), max_depth=1)
+    )
+
+    assert second is first
+    assert shallow is not first
+    assert len(outline_tool.state.outline_cache) == 2
+
+
+@pytest.mark.asyncio
+async def test_reparses_outline_after_file_changes(
+    outline_tool, python_file, age_mtime
+):
+    age_mtime(python_file)
+    await outline_tool.run(ViewFileOutlineArgs(path=str(python_file)))
+
+    python_file.write_text("def only():\n    pass\n")
+    result = await outline_tool.run(ViewFileOutlineArgs(path=str(python_file)))
+
+    assert [s.name for s in result.symbols] == ["only"]
+
+
+@pytest.mark.asyncio
+async def test_keeps_outline_when_only_mtime_changes(
+    outline_tool, python_file, age_mtime
+):
+    age_mtime(python_file)
+    first = await outline_tool.run(ViewFileOutlineArgs(path=str(python_file)))
+
+    age_mtime(python_file, seconds=5)
+    second = await outline_tool.run(ViewFileOutlineArgs(path=str(python_file)))
+
+    assert second is first
+
+
+@pytest.mark.asyncio
+async def test_outlines_empty_file(outline_tool, tmp_path):
+    empty = tmp_path / "empty.py"
+    empty.write_bytes(b"")
+
+    result = await outline_tool.run(ViewFileOutlineArgs(path=str(empty)))
+
+    assert result.symbols == []
+    assert result.total_lines == 0
+
+
+@pytest.mark.parametrize(
+    "edit",
+    [
+        lambda src: src.replace(b"return a + b", b"return a - b"),
+        lambda src: src.replace(b"class AdvancedCalc", b"class Advanced\xc3\xa9Calc"),
+        lambda src: b"import os\n\n" + src,
+        lambda src: src + b"\ndef tail():\n    pass\n",
+        lambda src: src.replace(b"    def add(self, x: int) -> int:\n", b""),
+        lambda src: b"",
+    ],
+)
+def test_incremental_parse_matches_full_parse(outline_tool, python_file, edit):
+    tree_sitter = pytest.importorskip("tree_sitter")
+    from vibe.core.tools.builtins.view_file_outline import _PY_LANGUAGE
+
+    source = python_file.read_bytes()
+    cache = outline_tool.state.tree_cache
+    cache.parse("example", source)
+
+    edited = edit(source)
+    incremental = cache.parse("example", edited)
+    full = tree_sitter.Parser(_PY_LANGUAGE).parse(edited)
+
+    assert str(incremental.root_node) == str(full.root_node)
+    assert incremental.root_node.end_byte == len(edited)
+    assert len(cache) == 1
+
+
+@pytest.mark.asyncio
+async def test_outline_reflects_edits_to_cached_tree(outline_tool, python_file):
+    pytest.importorskip("tree_sitter")
+    await outline_tool.run(ViewFileOutlineArgs(path=str(python_file)))
+
+    python_file.write_text(python_file.read_text().replace("def add(", "def plus("))
+    result = await outline_tool.run(ViewFileOutlineArgs(path=str(python_file)))
+
+    assert "plus" in [s.name for s in result.symbols]
+    calc_class = next(s for s in result.symbols if s.name == "Calculator")
+    assert "plus" in [c.name for c in calc_class.children]
+
+
+@pytest.mark.asyncio
+async def test_counts_last_line_without_trailing_newline(outline_tool, tmp_path):
+    file_path = tmp_path / "no_newline.py"
+    file_path.write_bytes(b"x = 1\r\ny = 2")
+
+    result = await outline_tool.run(ViewFileOutlineArgs(path=str(file_path)))
+
+    assert result.total_lines == 2
@@ -13,7 +13,7 @@ from vibe.acp.tools.base import (
     ToolCallSessionUpdateProtocol,
     ToolResultSessionUpdateProtocol,
 )
-from vibe.core.tools.ui import ToolUIDataAdapter
+from vibe.core.tools.ui import get_ui_adapter
 from vibe.core.types import ToolCallEvent, ToolResultEvent
 from vibe.core.utils import TaggedText, is_user_cancellation_event
 
@@ -24,7 +24,7 @@ def tool_call_session_update(event: ToolCallEvent) -> SessionUpdate | None:
     if issubclass(event.tool_class, ToolCallSessionUpdateProtocol):
         return event.tool_class.tool_call_session_update(event)
 
-    adapter = ToolUIDataAdapter(event.tool_class)
+    adapter = get_ui_adapter(event.tool_class)
     display = adapter.get_call_display(event)
     content: list[ToolCallContentVariant] | None = (
         [
@@ -89,7 +89,7 @@ def tool_result_session_update(event: ToolResultEvent) -> SessionUpdate | None:
             )
         ]
     else:
-        adapter = ToolUIDataAdapter(event.tool_class)
+        adapter = get_ui_adapter(event.tool_class)
         display = adapter.get_result_display(event)
         content: list[ToolCallContentVariant] | None = (
             [
@@ -3,7 +3,7 @@ from __future__ import annotations
 import asyncio
 from pathlib import Path
 
-from vibe.core.json_utils import dumps, loads
+from vibe.core.json_utils import dump_bytes, loads
 
 
 class HistoryManager:
@@ -41,9 +41,10 @@ class HistoryManager:
     def _save_history_sync(self) -> None:
         try:
             self.history_file.parent.mkdir(parents=True, exist_ok=True)
-            with self.history_file.open("w", encoding="utf-8") as f:
+            with self.history_file.open("wb") as f:
                 for entry in self._entries:
-                    f.write(dumps(entry) + "\n")
+                    dump_bytes(entry, f)
+                    f.write(b"\n")
         except OSError:
             pass
 
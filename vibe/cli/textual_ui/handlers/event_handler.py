@@ -91,9 +91,9 @@ class EventHandler:
         tool_call = ToolCallMessage(event)
 
         if loading_widget and event.tool_class:
-            from vibe.core.tools.ui import ToolUIDataAdapter
+            from vibe.core.tools.ui import get_ui_adapter
 
-            adapter = ToolUIDataAdapter(event.tool_class)
+            adapter = get_ui_adapter(event.tool_class)
             status_text = adapter.get_status_text()
             loading_widget.set_status(status_text)
 
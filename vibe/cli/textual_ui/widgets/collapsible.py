@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Any
+from collections import Counter
+from typing import Any, ClassVar
 
 from textual.app import ComposeResult
 from textual.containers import Vertical
@@ -42,26 +43,42 @@ class CollapsibleSection(Static):
         self._status_style = status_style
         self._header: Static | None = None
         self._content_container: Vertical | None = None
+        self._header_affixes = self._build_header_affixes()
+        self._last_header_text: str | None = None
         self.expanded = expanded
 
     def compose(self) -> ComposeResult:
-        self._header = Static(self._render_header(), classes="collapsible-header")
+        self._last_header_text = self._render_header()
+        self._header = Static(self._last_header_text, classes="collapsible-header")
         yield self._header
         self._content_container = Vertical(classes="collapsible-content")
         if not self.expanded:
             self._content_container.styles.display = "none"
         yield self._content_container
 
-    def _render_header(self) -> str:
-        arrow = self.ARROW_EXPANDED if self.expanded else self.ARROW_COLLAPSED
+    def _build_header_affixes(self) -> tuple[str, str]:
+        # Everything around the arrow only changes with title/icon/style, so
+        # it is assembled once per change instead of on every render.
         icon_part = f"{self._icon} " if self._icon else ""
         if self._status_style:
-            return f"[{self._status_style}]{arrow}[/] {icon_part}{self._title}"
-        return f"{arrow} {icon_part}{self._title}"
+            return f"[{self._status_style}]", f"[/] {icon_part}{self._title}"
+        return "", f" {icon_part}{self._title}"
+
+    def _render_header(self) -> str:
+        prefix, suffix = self._header_affixes
+        arrow = self.ARROW_EXPANDED if self.expanded else self.ARROW_COLLAPSED
+        return f"{prefix}{arrow}{suffix}"
+
+    def _refresh_header(self) -> None:
+        if not self._header:
+            return
+        text = self._render_header()
+        if text != self._last_header_text:
+            self._last_header_text = text
+            self._header.update(text)
 
     def watch_expanded(self, expanded: bool) -> None:
-        if self._header:
-            self._header.update(self._render_header())
+        self._refresh_header()
         if self._content_container:
             self._content_container.styles.display = "block" if expanded else "none"
 
@@ -73,18 +90,18 @@ class CollapsibleSection(Static):
 
     def update_title(self, title: str) -> None:
         self._title = title
-        if self._header:
-            self._header.update(self._render_header())
+        self._header_affixes = self._build_header_affixes()
+        self._refresh_header()
 
     def update_icon(self, icon: str) -> None:
         self._icon = icon
-        if self._header:
-            self._header.update(self._render_header())
+        self._header_affixes = self._build_header_affixes()
+        self._refresh_header()
 
     def update_status_style(self, style: str) -> None:
         self._status_style = style
-        if self._header:
-            self._header.update(self._render_header())
+        self._header_affixes = self._build_header_affixes()
+        self._refresh_header()
 
     @property
     def content_container(self) -> Vertical | None:
@@ -93,8 +110,7 @@ class CollapsibleSection(Static):
     async def set_content(self, *widgets: Static) -> None:
         if self._content_container:
             await self._content_container.remove_children()
-            for widget in widgets:
-                await self._content_container.mount(widget)
+            await self._content_container.mount(*widgets)
 
 
 class ToolSection(CollapsibleSection):
@@ -117,19 +133,29 @@ class ToolSection(CollapsibleSection):
         self._success = success
         self._pending = pending
 
+    STATUS_ICONS: ClassVar[dict[tuple[bool | None, bool], str]] = {
+        (None, True): "○",
+        (None, False): "●",
+        (True, False): "●",
+        (False, False): "●",
+    }
+    STATUS_STYLES: ClassVar[dict[tuple[bool | None, bool], str]] = {
+        (None, True): "$text-muted",
+        (None, False): "$foreground",
+        (True, False): "$success",
+        (False, False): "$error",
+    }
+
+    @staticmethod
+    def _status_key(success: bool | None, pending: bool) -> tuple[bool | None, bool]:
+        # Pending wins over any success value.
+        return (None, True) if pending else (success, False)
+
     def _get_status_icon(self, success: bool | None, pending: bool) -> str:
-        if pending:
-            return "○"
-        if success is None:
-            return "●"
-        return "●" if success else "●"
+        return self.STATUS_ICONS[self._status_key(success, pending)]
 
     def _get_status_style(self, success: bool | None, pending: bool) -> str:
-        if pending:
-            return "$text-muted"
-        if success is None:
-            return "$foreground"
-        return "$success" if success else "$error"
+        return self.STATUS_STYLES[self._status_key(success, pending)]
 
     def set_status(self, success: bool | None = None, pending: bool = False) -> None:
         self._success = success
@@ -144,31 +170,61 @@ class ThinkingSection(CollapsibleSection):
     def __init__(self, title: str = "Thinking", **kwargs: Any) -> None:
         super().__init__(title, icon="◐", status_style="$warning", **kwargs)
         self._thinking_lines: list[str] = []
+        self._thinking_seen: set[str] = set()
 
     async def add_thinking_line(self, line: str) -> None:
-        if line in self._thinking_lines:
+        if line in self._thinking_seen:
             return
+        self._thinking_seen.add(line)
         self._thinking_lines.append(line)
-        await self._refresh_content()
+        # Lines only ever get appended, so mount just the new one instead of
+        # rebuilding every line widget per streamed line.
+        if self._content_container:
+            await self._content_container.mount(self._line_widget(line))
+
+    async def on_mount(self) -> None:
+        # Lines added before compose had no container to go into.
+        if self._thinking_lines:
+            await self._refresh_content()
+
+    @staticmethod
+    def _line_widget(line: str) -> Static:
+        return Static(f"  {line}", markup=False, classes="thinking-line")
 
     async def _refresh_content(self) -> None:
         if self._content_container:
             await self._content_container.remove_children()
-            for line in self._thinking_lines:
-                await self._content_container.mount(
-                    Static(f"  {line}", markup=False, classes="thinking-line")
-                )
+            await self._content_container.mount(
+                *(self._line_widget(line) for line in self._thinking_lines)
+            )
 
     def clear(self) -> None:
         self._thinking_lines.clear()
+        self._thinking_seen.clear()
+        if self._content_container:
+            self._content_container.remove_children()
 
 
 class TodoSection(CollapsibleSection):
     """A collapsible section for displaying task/todo items."""
 
+    TODO_ICONS: ClassVar[dict[str, str]] = {
+        "pending": "☐",
+        "in_progress": "◐",
+        "completed": "☑",
+        "cancelled": "☒",
+    }
+    TODO_CLASSES: ClassVar[dict[str, str]] = {
+        status: f"todo-{status}" for status in TODO_ICONS
+    }
+
     def __init__(self, title: str = "Tasks", **kwargs: Any) -> None:
         super().__init__(title, icon="☐", status_style="$primary", **kwargs)
         self._todos: list[dict[str, Any]] = []
+        self._todo_widgets: list[Static] = []
+        self._rendered_todos: list[tuple[str, str]] = []
+        self._empty_widget: Static | None = None
+        self._header_stats: tuple[int, int, int] | None = None
 
     async def update_todos(self, todos: list[dict[str, Any]]) -> None:
         self._todos = todos
@@ -176,9 +232,12 @@ class TodoSection(CollapsibleSection):
         self._update_header_stats()
 
     def _update_header_stats(self) -> None:
-        total = len(self._todos)
-        completed = sum(1 for t in self._todos if t.get("status") == "completed")
-        in_progress = sum(1 for t in self._todos if t.get("status") == "in_progress")
+        counts = Counter(t.get("status") for t in self._todos)
+        stats = (counts["completed"], counts["in_progress"], len(self._todos))
+        if stats == self._header_stats:
+            return
+        self._header_stats = stats
+        completed, in_progress, total = stats
 
         if total == 0:
             self.update_title("Tasks")
@@ -197,27 +256,57 @@ class TodoSection(CollapsibleSection):
             self.update_icon("☐")
             self.update_status_style("$primary")
 
+    async def on_mount(self) -> None:
+        if self._todos:
+            await self._refresh_content()
+
     async def _refresh_content(self) -> None:
-        if not self._content_container:
+        container = self._content_container
+        if not container:
             return
 
-        await self._content_container.remove_children()
-
         if not self._todos:
-            await self._content_container.mount(
-                Static("  No tasks", markup=False, classes="todo-empty")
-            )
+            if self._empty_widget is None:
+                await container.remove_children()
+                self._todo_widgets.clear()
+                self._rendered_todos.clear()
+                self._empty_widget = Static(
+                    "  No tasks", markup=False, classes="todo-empty"
+                )
+                await container.mount(self._empty_widget)
             return
 
-        for todo in self._todos:
-            content = todo.get("content", "")
-            status = todo.get("status", "pending")
-            icon = self._get_todo_icon(status)
-            style_class = f"todo-{status}"
-            await self._content_container.mount(
-                Static(f"  {icon} {content}", markup=False, classes=style_class)
-            )
-
-    def _get_todo_icon(self, status: str) -> str:
-        icons = {"pending": "☐", "in_progress": "◐", "completed": "☑", "cancelled": "☒"}
-        return icons.get(status, "☐")
+        if self._empty_widget is not None:
+            await self._empty_widget.remove()
+            self._empty_widget = None
+
+        # Update rows in place and only mount/remove the tail, so a status
+        # change on one todo touches one widget instead of the whole list.
+        rows = [self._render_todo(todo) for todo in self._todos]
+        for widget, old, row in zip(
+            self._todo_widgets, self._rendered_todos, rows, strict=False
+        ):
+            if row != old:
+                widget.update(row[0])
+                widget.set_classes(row[1])
+
+        kept = len(self._todo_widgets)
+        if len(rows) > kept:
+            new_widgets = [
+                Static(text, markup=False, classes=style_class)
+                for text, style_class in rows[kept:]
+            ]
+            self._todo_widgets.extend(new_widgets)
+            await container.mount(*new_widgets)
+        elif len(rows) < kept:
+            stale = self._todo_widgets[len(rows) :]
+            del self._todo_widgets[len(rows) :]
+            await container.remove_children(stale)
+        self._rendered_todos = rows
+
+    def _render_todo(self, todo: dict[str, Any]) -> tuple[str, str]:
+        content = todo.get("content", "")
+        status = todo.get("status", "pending")
+        icon = self.TODO_ICONS.get(status, "☐")
+        style_class = self.TODO_CLASSES.get(status) or f"todo-{status}"
+        return f"  {icon} {content}", style_class
@@ -4,11 +4,12 @@ from typing import Any
 
 from textual.app import ComposeResult
 from textual.containers import Vertical
+from textual.widget import Widget
 from textual.widgets import Static
 
 from vibe.cli.textual_ui.renderers import get_renderer
 from vibe.cli.textual_ui.widgets.collapsible import ToolSection
-from vibe.core.tools.ui import ToolUIDataAdapter
+from vibe.core.tools.ui import ToolResultDisplay, get_ui_adapter
 from vibe.core.types import ToolCallEvent, ToolResultEvent
 
 
@@ -20,13 +21,14 @@ class ToolCallMessage(Static):
         self._success: bool | None = None
         self._pending = True
         self._section: ToolSection | None = None
+        # Events are immutable, so the title is fixed for the widget's life.
+        self._title = self._get_title()
         super().__init__()
         self.add_class("tool-call")
 
     def compose(self) -> ComposeResult:
-        title = self._get_title()
         self._section = ToolSection(
-            title,
+            self._title,
             expanded=False,
             success=None,
             pending=True,
@@ -38,7 +40,7 @@ class ToolCallMessage(Static):
         if not self.event.tool_class:
             return f"{self.event.tool_name}"
 
-        adapter = ToolUIDataAdapter(self.event.tool_class)
+        adapter = get_ui_adapter(self.event.tool_class)
         display = adapter.get_call_display(self.event)
         return display.summary
 
@@ -64,6 +66,8 @@ class ToolResultMessage(Static):
         self.call_widget = call_widget
         self.collapsed = collapsed
         self._content_container: Vertical | None = None
+        self._views: dict[bool, Widget] = {}
+        self._display: ToolResultDisplay | None = None
 
         super().__init__()
         self.add_class("tool-result")
@@ -82,61 +86,53 @@ class ToolResultMessage(Static):
         if not self._content_container:
             return
 
-        await self._content_container.remove_children()
-
         if self.event.error:
             self.add_class("error-text")
-            await self._render_error()
-            return
-
-        if self.event.skipped:
+        elif self.event.skipped:
             self.add_class("warning-text")
-            await self._render_skipped()
-            return
-
-        self.remove_class("error-text")
-        self.remove_class("warning-text")
-        await self._render_success()
-
-    async def _render_error(self) -> None:
-        if not self._content_container:
-            return
-
-        if self.collapsed:
-            await self._content_container.mount(
-                Static("Error (click to expand)", markup=False)
-            )
         else:
-            await self._content_container.mount(
-                Static(f"Error: {self.event.error}", markup=False)
-            )
+            self.remove_class("error-text")
+            self.remove_class("warning-text")
+
+        # The event never changes after construction, so each collapsed state
+        # is built once and toggling only flips which view is displayed.
+        view = self._views.get(self.collapsed)
+        if view is None:
+            view = self._build_view()
+            self._views[self.collapsed] = view
+            await self._content_container.mount(view)
+        for other in self._views.values():
+            other.display = other is view
+
+    def _build_view(self) -> Widget:
+        if self.event.error:
+            return self._render_error()
+        if self.event.skipped:
+            return self._render_skipped()
+        return self._render_success()
 
-    async def _render_skipped(self) -> None:
-        if not self._content_container:
-            return
+    def _render_error(self) -> Widget:
+        if self.collapsed:
+            return Static("Error (click to expand)", markup=False)
+        return Static(f"Error: {self.event.error}", markup=False)
 
+    def _render_skipped(self) -> Widget:
         reason = self.event.skip_reason or "User skipped"
         if self.collapsed:
-            await self._content_container.mount(
-                Static("Skipped (click to expand)", markup=False)
-            )
-        else:
-            await self._content_container.mount(
-                Static(f"Skipped: {reason}", markup=False)
-            )
-
-    async def _render_success(self) -> None:
-        if not self._content_container:
-            return
+            return Static("Skipped (click to expand)", markup=False)
+        return Static(f"Skipped: {reason}", markup=False)
 
-        adapter = ToolUIDataAdapter(self.event.tool_class)
-        display = adapter.get_result_display(self.event)
+    def _render_success(self) -> Widget:
+        # Shared by the collapsed and expanded views; error and skip events
+        # (which may carry no tool class) never get here.
+        if self._display is None:
+            adapter = get_ui_adapter(self.event.tool_class)
+            self._display = adapter.get_result_display(self.event)
 
         renderer = get_renderer(self.event.tool_name)
-        widget_class, data = renderer.get_result_widget(display, self.collapsed)
+        widget_class, data = renderer.get_result_widget(self._display, self.collapsed)
 
-        result_widget = widget_class(data, collapsed=self.collapsed)
-        await self._content_container.mount(result_widget)
+        return widget_class(data, collapsed=self.collapsed)
 
     async def on_click(self, event: Any) -> None:
         await self.toggle_collapsed()
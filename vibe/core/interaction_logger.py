@@ -8,7 +8,7 @@ from typing import TYPE_CHECKING, Any
 
 import aiofiles
 
-from vibe.core.json_utils import dumps, loads
+from vibe.core.json_utils import dumps_bytes, loads
 from vibe.core.llm.format import get_active_tool_classes
 from vibe.core.types import AgentStats, LLMMessage, SessionInfo, SessionMetadata
 from vibe.core.utils import is_windows
@@ -153,9 +153,9 @@ class InteractionLogger:
         }
 
         try:
-            json_content = dumps(interaction_data, indent=2, ensure_ascii=False)
+            json_content = dumps_bytes(interaction_data, indent=2, ensure_ascii=False)
 
-            async with aiofiles.open(self.filepath, "w", encoding="utf-8") as f:
+            async with aiofiles.open(self.filepath, "wb") as f:
                 await f.write(json_content)
 
             return str(self.filepath)
@@ -238,9 +238,7 @@ class InteractionLogger:
         import asyncio
 
         def _load_sync() -> tuple[list[LLMMessage], dict[str, Any]]:
-            with filepath.open("r", encoding="utf-8") as f:
-                content = f.read()
-            data = loads(content)
+            data = loads(filepath.read_bytes())
             messages = [
                 LLMMessage.model_validate(msg) for msg in data.get("messages", [])
             ]
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+from collections.abc import Callable
+from functools import partial
 import json
-from typing import Any, TextIO
+from typing import Any, BinaryIO, TextIO
 
 try:
     import orjson
@@ -11,18 +13,26 @@ except ImportError:
 
 ORJSON_INDENT_2 = 2
 
+# orjson serializers bound once per (indent, ensure_ascii) combination it can
+# produce; anything else (other indents, no orjson) goes through json.
+_ORJSON_DUMPS: dict[tuple[int | None, bool], Callable[[Any], bytes]] = {}
+if orjson is not None:
+    _OPT_ASCII = int(getattr(orjson, "OPT_ESCAPE_UNICODE", 0))
+    _ORJSON_DUMPS = {
+        (None, True): partial(orjson.dumps, option=_OPT_ASCII),
+        (None, False): partial(orjson.dumps, option=0),
+        (ORJSON_INDENT_2, True): partial(
+            orjson.dumps, option=_OPT_ASCII | orjson.OPT_INDENT_2
+        ),
+        (ORJSON_INDENT_2, False): partial(orjson.dumps, option=orjson.OPT_INDENT_2),
+    }
+
 
 def dumps_bytes(
     obj: Any, *, indent: int | None = None, ensure_ascii: bool = True
 ) -> bytes:
-    if orjson is not None:
-        option = 0
-        if ensure_ascii:
-            option |= int(getattr(orjson, "OPT_ESCAPE_UNICODE", 0))
-        if indent is None:
-            return orjson.dumps(obj, option=option)
-        if indent == ORJSON_INDENT_2:
-            return orjson.dumps(obj, option=option | orjson.OPT_INDENT_2)
+    if (fast_dumps := _ORJSON_DUMPS.get((indent, ensure_ascii))) is not None:
+        return fast_dumps(obj)
 
     return json.dumps(obj, ensure_ascii=ensure_ascii, indent=indent).encode("utf-8")
 
@@ -33,8 +43,7 @@ def dumps(obj: Any, *, indent: int | None = None, ensure_ascii: bool = True) ->
 
 def loads(data: str | bytes | bytearray | memoryview) -> Any:
     if orjson is not None:
-        if isinstance(data, str):
-            return orjson.loads(data.encode("utf-8"))
+        # orjson parses str directly; encoding first only copied the payload.
         return orjson.loads(data)
     if isinstance(data, (bytes, bytearray, memoryview)):
         data = bytes(data).decode("utf-8")
@@ -45,3 +54,9 @@ def dump(
     obj: Any, fp: TextIO, *, indent: int | None = None, ensure_ascii: bool = True
 ) -> None:
     fp.write(dumps(obj, indent=indent, ensure_ascii=ensure_ascii))
+
+
+def dump_bytes(
+    obj: Any, fp: BinaryIO, *, indent: int | None = None, ensure_ascii: bool = True
+) -> None:
+    fp.write(dumps_bytes(obj, indent=indent, ensure_ascii=ensure_ascii))
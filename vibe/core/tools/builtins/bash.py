@@ -3,7 +3,6 @@ from __future__ import annotations
 import asyncio
 import os
 import re
-import signal
 import sys
 from typing import ClassVar, Literal, final
 
@@ -16,7 +15,7 @@ from vibe.core.tools.base import (
     ToolError,
     ToolPermission,
 )
-from vibe.core.utils import is_windows
+from vibe.core.utils import is_windows, kill_process_tree
 
 
 def _get_subprocess_encoding() -> str:
@@ -51,33 +50,6 @@ def _get_base_env() -> dict[str, str]:
     return base_env
 
 
-async def _kill_process_tree(proc: asyncio.subprocess.Process) -> None:
-    if proc.returncode is not None:
-        return
-
-    try:
-        if sys.platform == "win32":
-            try:
-                subprocess_proc = await asyncio.create_subprocess_exec(
-                    "taskkill",
-                    "/F",
-                    "/T",
-                    "/PID",
-                    str(proc.pid),
-                    stdout=asyncio.subprocess.DEVNULL,
-                    stderr=asyncio.subprocess.DEVNULL,
-                )
-                await subprocess_proc.wait()
-            except (FileNotFoundError, OSError):
-                proc.terminate()
-        else:
-            os.killpg(os.getpgid(proc.pid), signal.SIGKILL)
-
-        await proc.wait()
-    except (ProcessLookupError, PermissionError, OSError):
-        pass
-
-
 def _get_default_allowlist() -> list[str]:
     common = ["echo", "find", "git diff", "git log", "git status", "tree", "whoami"]
 
@@ -252,7 +224,7 @@ class Bash(BaseTool[BashArgs, BashResult, BashToolConfig, BaseToolState]):
                     proc.communicate(), timeout=timeout
                 )
             except TimeoutError:
-                await _kill_process_tree(proc)
+                await kill_process_tree(proc)
                 raise self._build_timeout_error(args.command, timeout)
 
             encoding = _get_subprocess_encoding()
@@ -281,5 +253,5 @@ class Bash(BaseTool[BashArgs, BashResult, BashToolConfig, BaseToolState]):
         except Exception as exc:
             raise ToolError(f"Error running command {args.command!r}: {exc}") from exc
         finally:
-            if proc is not None:
-                await _kill_process_tree(proc)
+            if proc is not None and proc.returncode is None:
+                await kill_process_tree(proc)
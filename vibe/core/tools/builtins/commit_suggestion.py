@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import asyncio
+from dataclasses import dataclass
+import os
 from pathlib import Path
+import time
 from typing import TYPE_CHECKING, ClassVar, final
 
 from pydantic import BaseModel, Field
@@ -30,6 +33,17 @@ class FileDiff(BaseModel):
 MAX_PREVIEW_FILES = 5
 MAX_CHANGES_FOR_FIX = 20
 MIN_SPLIT_PARTS = 2
+MIN_NUMSTAT_PARTS = 3
+DIFF_PREVIEW_CHARS = 500
+# Enough bytes to decode DIFF_PREVIEW_CHARS characters of any UTF-8 text.
+DIFF_PREVIEW_BYTES = DIFF_PREVIEW_CHARS * 4
+
+_DIFF_HEADER = b"\ndiff --git "
+_PATCH_READ_CHUNK = 64 * 1024
+
+# An index rewritten this recently may be rewritten again within the same
+# timestamp tick, so its stat data cannot vouch for a cached scan yet.
+_RACY_STAT_WINDOW_NS = 1_000_000_000
 
 
 class CommitSuggestionArgs(BaseModel):
@@ -57,8 +71,60 @@ class CommitSuggestionToolConfig(BaseToolConfig):
     permission: ToolPermission = ToolPermission.ALWAYS
 
 
+@dataclass(slots=True)
+class _StagedSnapshot:
+    key: tuple[object, ...]
+    files: list[FileDiff]
+    stats: str
+
+
+class _PatchPreviews:
+    """Splits a streamed `git diff` patch into per-file previews.
+
+    Only the first `limit` bytes of each file's section are kept, so memory
+    stays bounded however large the staged changes are.
+    """
+
+    def __init__(self, limit: int) -> None:
+        self._limit = limit
+        self._previews: dict[bytes, bytearray] = {}
+        self._current: bytearray | None = None
+        # The leading newline lets the very first header match _DIFF_HEADER.
+        self._pending = b"\n"
+
+    def feed(self, chunk: bytes) -> None:
+        data = self._pending + chunk
+        pos = 0
+        while (start := data.find(_DIFF_HEADER, pos)) >= 0:
+            self._append(data[pos:start])
+            eol = data.find(b"\n", start + 1)
+            if eol < 0:
+                self._pending = data[start:]
+                return
+            self._current = bytearray()
+            self._previews[data[start + len(_DIFF_HEADER) : eol]] = self._current
+            pos = start + 1
+
+        # A header may straddle two chunks, so its possible prefix is held back.
+        keep = max(pos, len(data) - len(_DIFF_HEADER) + 1)
+        self._append(data[pos:keep])
+        self._pending = data[keep:]
+
+    def finish(self) -> dict[bytes, bytes]:
+        self._append(self._pending)
+        self._pending = b""
+        return {key: bytes(preview) for key, preview in self._previews.items()}
+
+    def _append(self, data: bytes) -> None:
+        current = self._current
+        if current is not None and (room := self._limit - len(current)) > 0:
+            current += data[:room]
+
+
 class CommitSuggestionState(BaseToolState):
-    pass
+    # workdir -> (git dir, common git dir), as reported by `git rev-parse`.
+    git_dirs: dict[Path, tuple[Path, Path]] = Field(default_factory=dict, exclude=True)
+    staged: _StagedSnapshot | None = Field(default=None, exclude=True)
 
 
 class CommitSuggestion(
@@ -79,11 +145,27 @@ class CommitSuggestion(
     async def run(self, args: CommitSuggestionArgs) -> CommitSuggestionResult:
         workdir = self.config.effective_workdir
 
-        is_git = await self._is_git_repo(workdir)
-        if not is_git:
-            raise ToolError("Not a git repository")
-
-        files = await self._get_staged_files(workdir, args.max_files)
+        git_dirs = self._cached_git_dirs(workdir)
+        key = self._staged_key(git_dirs, args.max_files) if git_dirs else None
+        snapshot = self.state.staged
+        if key is not None and snapshot is not None and snapshot.key == key:
+            files, stats = snapshot.files, snapshot.stats
+        else:
+            # Outside a repository every probe just fails fast, so they are
+            # started together rather than gated on the repository check.
+            git_dirs, files, stats = await asyncio.gather(
+                self._find_git_dirs(workdir),
+                self._get_staged_files(workdir, args.max_files),
+                self._get_stats(workdir),
+            )
+            if git_dirs is None:
+                raise ToolError("Not a git repository")
+            # An index written while git was running is too fresh to produce
+            # a key, so a key taken after the scan still describes its input.
+            if key is None:
+                key = self._staged_key(git_dirs, args.max_files)
+            if key is not None:
+                self.state.staged = _StagedSnapshot(key, files, stats)
 
         if not files:
             unstaged = await self._get_unstaged_files(workdir)
@@ -108,8 +190,6 @@ class CommitSuggestion(
         if body:
             full_message = f"{title}\n\n{body}"
 
-        stats = await self._get_stats(workdir)
-
         return CommitSuggestionResult(
             has_changes=True,
             title=title,
@@ -121,6 +201,12 @@ class CommitSuggestion(
         )
 
     async def _run_git(self, workdir: Path, *args: str) -> tuple[str, int]:
+        stdout, code = await self._run_git_bytes(workdir, *args)
+        return stdout.decode("utf-8", errors="replace").strip(), code
+
+    async def _run_git_bytes(
+        self, workdir: Path, *args: str | bytes
+    ) -> tuple[bytes, int]:
         proc = await asyncio.create_subprocess_exec(
             "git",
             *args,
@@ -129,80 +215,183 @@ class CommitSuggestion(
             stderr=asyncio.subprocess.PIPE,
         )
         stdout, _ = await proc.communicate()
-        return stdout.decode("utf-8", errors="replace").strip(), proc.returncode or 0
+        return stdout, proc.returncode or 0
 
-    async def _is_git_repo(self, workdir: Path) -> bool:
-        _, code = await self._run_git(workdir, "rev-parse", "--git-dir")
-        return code == 0
+    async def _read_patch_previews(
+        self, workdir: Path, *args: str | bytes
+    ) -> dict[bytes, bytes]:
+        # The patch is consumed as it streams in: past each file's preview,
+        # its bytes are dropped instead of buffering the whole diff.
+        proc = await asyncio.create_subprocess_exec(
+            "git",
+            *args,
+            cwd=workdir,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        assert proc.stdout is not None
+        previews = _PatchPreviews(DIFF_PREVIEW_BYTES)
+        while chunk := await proc.stdout.read(_PATCH_READ_CHUNK):
+            previews.feed(chunk)
+        await proc.wait()
+        return previews.finish()
+
+    def _cached_git_dirs(self, workdir: Path) -> tuple[Path, Path] | None:
+        git_dirs = self.state.git_dirs.get(workdir)
+        if git_dirs is None or not git_dirs[0].is_dir():
+            return None
+        return git_dirs
+
+    async def _find_git_dirs(self, workdir: Path) -> tuple[Path, Path] | None:
+        out, code = await self._run_git(
+            workdir, "rev-parse", "--absolute-git-dir", "--git-common-dir"
+        )
+        lines = out.splitlines()
+        if code != 0 or len(lines) < MIN_SPLIT_PARTS:
+            self.state.git_dirs.pop(workdir, None)
+            return None
+        git_dirs = (Path(lines[0]), (workdir / lines[1]).resolve())
+        self.state.git_dirs[workdir] = git_dirs
+        return git_dirs
+
+    def _staged_key(
+        self, git_dirs: tuple[Path, Path], max_files: int
+    ) -> tuple[object, ...] | None:
+        # Staged changes are the index compared with HEAD, so the index file
+        # and whatever HEAD resolves to pin them down. Returns None whenever
+        # that cannot be established cheaply and reliably.
+        git_dir, common_dir = git_dirs
+        try:
+            index = os.stat(git_dir / "index")
+            head = (git_dir / "HEAD").read_bytes()
+        except OSError:
+            return None
+        if time.time_ns() - index.st_mtime_ns < _RACY_STAT_WINDOW_NS:
+            return None
+
+        target: object = head
+        if head.startswith(b"ref: "):
+            ref = common_dir / head[5:].strip().decode("utf-8", errors="replace")
+            try:
+                target = ref.read_bytes()
+            except OSError:
+                try:
+                    packed = os.stat(common_dir / "packed-refs")
+                except OSError:
+                    return None
+                target = (head, packed.st_ino, packed.st_mtime_ns, packed.st_size)
+
+        return (max_files, index.st_ino, index.st_mtime_ns, index.st_size, target)
 
     async def _get_staged_files(self, workdir: Path, max_files: int) -> list[FileDiff]:
-        out, _ = await self._run_git(workdir, "diff", "--cached", "--name-status")
-        files: list[FileDiff] = []
+        summary, _ = await self._run_git_bytes(
+            workdir, "diff", "--cached", "--raw", "--numstat", "-z"
+        )
+        entries, counts = self._parse_raw_numstat(summary)
+        entries = entries[:max_files]
+        if not entries:
+            return []
+
+        # One patch for every previewed file instead of a `git diff` per file;
+        # it is split back up by matching each section's header line.
+        pathspec = list(dict.fromkeys(p for _, old, new in entries for p in (old, new)))
+        previews = await self._read_patch_previews(
+            workdir,
+            "--literal-pathspecs",
+            "-c",
+            "core.quotePath=false",
+            "diff",
+            "--cached",
+            "--src-prefix=a/",
+            "--dst-prefix=b/",
+            "--",
+            *pathspec,
+        )
 
         status_map = {"A": "added", "M": "modified", "D": "deleted", "R": "renamed"}
-
-        for line in out.splitlines()[:max_files]:
-            if not line:
-                continue
-            parts = line.split("\t", 1)
-            if len(parts) >= MIN_SPLIT_PARTS:
-                status_char = parts[0][0]
-                path = parts[1]
-
-                numstat, _ = await self._run_git(
-                    workdir, "diff", "--cached", "--numstat", "--", path
-                )
-                additions = deletions = 0
-                if numstat:
-                    nums = numstat.split()
-                    if len(nums) >= MIN_SPLIT_PARTS:
-                        additions = int(nums[0]) if nums[0].isdigit() else 0
-                        deletions = int(nums[1]) if nums[1].isdigit() else 0
-
-                diff_preview, _ = await self._run_git(
-                    workdir, "diff", "--cached", "--", path
-                )
-                diff_preview = diff_preview[:500] if diff_preview else ""
-
-                files.append(
-                    FileDiff(
-                        path=path,
-                        status=status_map.get(status_char, "modified"),
-                        additions=additions,
-                        deletions=deletions,
-                        diff_preview=diff_preview,
-                    )
+        files: list[FileDiff] = []
+        for status_char, old, new in entries:
+            additions, deletions = counts.get(new, (0, 0))
+            preview = previews.get(b"a/%s b/%s" % (old, new), b"").decode(
+                "utf-8", errors="replace"
+            )
+            files.append(
+                FileDiff(
+                    path=new.decode("utf-8", errors="replace"),
+                    status=status_map.get(status_char, "modified"),
+                    additions=additions,
+                    deletions=deletions,
+                    diff_preview=preview.strip()[:DIFF_PREVIEW_CHARS],
                 )
+            )
 
         return files
 
+    def _parse_raw_numstat(
+        self, out: bytes
+    ) -> tuple[list[tuple[str, bytes, bytes]], dict[bytes, tuple[int, int]]]:
+        # With -z, --raw records come first as
+        # ":<modes> <shas> <status>\0<path>\0", with a second path for renames
+        # and copies: "... R100\0<old>\0<new>\0". The --numstat records follow
+        # as "<adds>\t<dels>\t<path>\0"; renames leave the path empty and
+        # follow it with "<old>\0<new>\0". Binary files report "-".
+        entries: list[tuple[str, bytes, bytes]] = []
+        counts: dict[bytes, tuple[int, int]] = {}
+        fields = iter(out.split(b"\0"))
+        for field in fields:
+            if field.startswith(b":"):
+                status_char = chr(field[field.rindex(b" ") + 1])
+                old = new = next(fields, b"")
+                if status_char in "RC":
+                    new = next(fields, b"")
+                entries.append((status_char, old, new))
+                continue
+
+            parts = field.split(b"\t", 2)
+            if len(parts) < MIN_NUMSTAT_PARTS:
+                continue
+            path = parts[2]
+            if not path:
+                next(fields, b"")
+                path = next(fields, b"")
+            counts[path] = (
+                int(parts[0]) if parts[0].isdigit() else 0,
+                int(parts[1]) if parts[1].isdigit() else 0,
+            )
+        return entries, counts
+
     async def _get_unstaged_files(self, workdir: Path) -> list[str]:
         out, _ = await self._run_git(workdir, "diff", "--name-only")
         return [f for f in out.splitlines() if f]
 
     async def _get_stats(self, workdir: Path) -> str:
-        out, _ = await self._run_git(workdir, "diff", "--cached", "--stat")
-        lines = out.splitlines()
-        if lines:
-            return lines[-1].strip()
-        return ""
+        out, _ = await self._run_git(workdir, "diff", "--cached", "--shortstat")
+        return out
 
     def _detect_commit_type(self, files: list[FileDiff]) -> str:
-        paths = [f.path.lower() for f in files]
-        statuses = [f.status for f in files]
-
-        if any("test" in p for p in paths):
-            return "test"
-        if any(p.endswith(".md") for p in paths):
+        # One pass collects every signal; a test path outranks all others, so
+        # finding one ends the scan.
+        has_docs = has_config = has_fix = False
+        all_added = True
+        total_changes = 0
+        for f in files:
+            p = f.path.lower()
+            if "test" in p:
+                return "test"
+            has_docs = has_docs or p.endswith(".md")
+            has_config = has_config or "config" in p
+            has_fix = has_fix or "fix" in p
+            all_added = all_added and f.status == "added"
+            total_changes += f.additions + f.deletions
+
+        if has_docs:
             return "docs"
-        if any(p.startswith("config") or "config" in p for p in paths):
+        if has_config:
             return "chore"
-        if all(s == "added" for s in statuses):
+        if all_added:
             return "feat"
-        if any("fix" in p for p in paths):
+        if has_fix:
             return "fix"
-
-        total_changes = sum(f.additions + f.deletions for f in files)
         return "fix" if total_changes < MAX_CHANGES_FOR_FIX else "feat"
 
     def _generate_title(  # noqa: PLR0911
@@ -225,14 +414,12 @@ class CommitSuggestion(
             else:
                 return f"{action.capitalize()} {file.path}"
 
-        dirs = set()
-        for f in files:
-            parts = Path(f.path).parts
-            if len(parts) > 1:
-                dirs.add(parts[0])
+        # Git reports normalized "/"-separated paths, so the top-level
+        # directory is everything before the first slash.
+        dirs = {f.path.partition("/")[0] for f in files if "/" in f.path}
 
         if len(dirs) == 1:
-            scope = list(dirs)[0]
+            (scope,) = dirs
             if style == "conventional":
                 return f"{commit_type}({scope}): update {len(files)} files"
             return f"Update {scope} ({len(files)} files)"
@@ -244,9 +431,15 @@ class CommitSuggestion(
     def _generate_body(self, files: list[FileDiff]) -> str:
         lines = []
 
-        added = [f for f in files if f.status == "added"]
-        modified = [f for f in files if f.status == "modified"]
-        deleted = [f for f in files if f.status == "deleted"]
+        by_status: dict[str, list[FileDiff]] = {
+            "added": [],
+            "modified": [],
+            "deleted": [],
+        }
+        for f in files:
+            if (bucket := by_status.get(f.status)) is not None:
+                bucket.append(f)
+        added, modified, deleted = by_status.values()
 
         if added:
             lines.append("Added:")
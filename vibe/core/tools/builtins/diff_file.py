@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 from pathlib import Path
+import re
 from typing import TYPE_CHECKING, ClassVar, final
 
 from pydantic import BaseModel, Field
@@ -59,6 +60,8 @@ class DiffFileState(BaseToolState):
 MAX_HUNKS_DISPLAY = 5
 MAX_LINES_DISPLAY = 3
 
+_HUNK_HEADER_RE = re.compile(r"^@@ -(\d+),?\d* \+(\d+),?\d* @@(.*)$")
+
 
 class DiffFile(
     BaseTool[DiffFileArgs, DiffFileResult, DiffFileToolConfig, DiffFileState],
@@ -74,21 +77,19 @@ class DiffFile(
         workdir = self.config.effective_workdir
         file_path = self._prepare_path(args.path)
 
-        is_git = await self._is_git_repo(workdir)
+        is_git, diff_text = await asyncio.gather(
+            self._is_git_repo(workdir),
+            self._get_diff(workdir, file_path, args.staged, args.context_lines),
+        )
         if not is_git:
             raise ToolError("Not a git repository")
 
-        diff_text = await self._get_diff(
-            workdir, file_path, args.staged, args.context_lines
-        )
-
         if not diff_text.strip():
             return DiffFileResult(
                 path=str(file_path), has_changes=False, summary="No changes"
             )
 
-        additions, deletions = self._count_changes(diff_text)
-        hunks = self._parse_hunks(diff_text)
+        additions, deletions, hunks = self._scan_diff(diff_text)
 
         summary = f"+{additions}/-{deletions} in {len(hunks)} hunk(s)"
 
@@ -137,29 +138,23 @@ class DiffFile(
         stdout, _ = await proc.communicate()
         return stdout.decode("utf-8", errors="replace")
 
-    def _count_changes(self, diff_text: str) -> tuple[int, int]:
+    def _scan_diff(self, diff_text: str) -> tuple[int, int, list[DiffHunk]]:
         additions = 0
         deletions = 0
-
-        for line in diff_text.splitlines():
-            if line.startswith("+") and not line.startswith("+++"):
-                additions += 1
-            elif line.startswith("-") and not line.startswith("---"):
-                deletions += 1
-
-        return additions, deletions
-
-    def _parse_hunks(self, diff_text: str) -> list[DiffHunk]:
         hunks: list[DiffHunk] = []
         current_hunk: DiffHunk | None = None
 
-        import re
-
-        hunk_header_re = re.compile(r"^@@ -(\d+),?\d* \+(\d+),?\d* @@(.*)$")
-
         for line in diff_text.splitlines():
-            match = hunk_header_re.match(line)
-            if match:
+            if line.startswith("-") and not line.startswith("---"):
+                deletions += 1
+                if current_hunk:
+                    current_hunk.old_lines.append(line[1:])
+            elif line.startswith("+") and not line.startswith("+++"):
+                additions += 1
+                if current_hunk:
+                    current_hunk.new_lines.append(line[1:])
+                    current_hunk.end_line += 1
+            elif line.startswith("@@") and (match := _HUNK_HEADER_RE.match(line)):
                 if current_hunk:
                     hunks.append(current_hunk)
 
@@ -168,19 +163,13 @@ class DiffFile(
                     end_line=int(match.group(2)),
                     header=match.group(3).strip(),
                 )
-            elif current_hunk:
-                if line.startswith("-") and not line.startswith("---"):
-                    current_hunk.old_lines.append(line[1:])
-                elif line.startswith("+") and not line.startswith("+++"):
-                    current_hunk.new_lines.append(line[1:])
-                    current_hunk.end_line += 1
-                elif not line.startswith("\\"):
-                    current_hunk.end_line += 1
+            elif current_hunk and not line.startswith("\\"):
+                current_hunk.end_line += 1
 
         if current_hunk:
             hunks.append(current_hunk)
 
-        return hunks
+        return additions, deletions, hunks
 
     @classmethod
     def get_call_display(cls, event: ToolCallEvent) -> ToolCallDisplay:
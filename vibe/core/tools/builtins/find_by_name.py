@@ -1,7 +1,14 @@
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Iterator
 import fnmatch
+from functools import cached_property, lru_cache
+import itertools
+import os
 from pathlib import Path
+import re
+import stat
 from typing import TYPE_CHECKING, ClassVar, final
 
 from pydantic import BaseModel, Field
@@ -13,6 +20,7 @@ from vibe.core.tools.base import (
     ToolError,
     ToolPermission,
 )
+from vibe.core.tools.dir_cache import DirEntryRecord, DirListingCache
 from vibe.core.tools.ui import ToolCallDisplay, ToolResultDisplay, ToolUIData
 
 if TYPE_CHECKING:
@@ -72,10 +80,30 @@ class FindByNameToolConfig(BaseToolConfig):
 
 
 class FindByNameState(BaseToolState):
-    pass
+    listing_cache: DirListingCache = Field(
+        default_factory=DirListingCache, exclude=True
+    )
 
 
 MAX_MATCHES_DISPLAY = 20
+_GLOB_CHARS = frozenset("*?[")
+# fnmatch.fnmatch() normcases both sides, so names match case-insensitively
+# where the platform's paths do (Windows); the compiled globs and literal
+# comparisons below keep that behaviour.
+_IGNORE_CASE = os.path.normcase("A") == "a"
+_GLOB_FLAGS = re.IGNORECASE if _IGNORE_CASE else 0
+
+
+def _fold_case(name: str) -> str:
+    return name.lower() if _IGNORE_CASE else name
+
+
+@lru_cache(maxsize=256)
+def _compile_glob(pattern: str) -> re.Pattern[str] | None:
+    """Translate a glob into a compiled regex, or None for a literal name."""
+    if _GLOB_CHARS.isdisjoint(pattern):
+        return None
+    return re.compile(fnmatch.translate(pattern), _GLOB_FLAGS)
 
 
 class FindByName(
@@ -122,12 +150,21 @@ class FindByName(
 
         return search_path
 
-    def _should_exclude(self, path: Path) -> bool:
-        name = path.name
-        for pattern in self.config.default_excludes:
-            if fnmatch.fnmatch(name, pattern):
-                return True
-        return False
+    @cached_property
+    def _exclude_rules(self) -> tuple[frozenset[str], re.Pattern[str] | None]:
+        # Most excludes are plain names like ".git"; those become a set lookup
+        # and the real globs like "*.pyc" are folded into a single regex.
+        excludes = self.config.default_excludes
+        literals = [p for p in excludes if _GLOB_CHARS.isdisjoint(p)]
+        globs = [fnmatch.translate(p) for p in excludes if p not in literals]
+        names = frozenset(map(_fold_case, literals))
+        return names, re.compile("|".join(globs), _GLOB_FLAGS) if globs else None
+
+    def _should_exclude(self, name: str) -> bool:
+        names, globs_re = self._exclude_rules
+        if _fold_case(name) in names:
+            return True
+        return globs_re is not None and globs_re.match(name) is not None
 
     async def _find_files(
         self,
@@ -137,8 +174,6 @@ class FindByName(
         file_type: str,
         include_hidden: bool,
     ) -> tuple[list[FileMatch], bool]:
-        import asyncio
-
         return await asyncio.to_thread(
             self._find_files_sync,
             search_path,
@@ -156,66 +191,130 @@ class FindByName(
         file_type: str,
         include_hidden: bool,
     ) -> tuple[list[FileMatch], bool]:
-        matches: list[FileMatch] = []
-        was_truncated = False
+        name_re = _compile_glob(pattern)
+        if name_re is None and "/" in pattern:
+            return self._find_literal_path(
+                search_path, pattern, max_depth, file_type, include_hidden
+            ), False
+
+        # Only matching entries leave the walk, and only the ones that fit are
+        # turned into FileMatch models; one extra tells us we truncated.
+        limit = self.config.max_results
+        found = list(
+            itertools.islice(
+                self._iter_matches(
+                    search_path, pattern, name_re, max_depth, file_type, include_hidden
+                ),
+                limit + 1,
+            )
+        )
+        matches = [self._to_match(entry) for entry in found[:limit]]
+        return matches, len(found) > limit
 
-        def search_recursive(current_path: Path, depth: int) -> bool:
-            nonlocal was_truncated
+    def _iter_matches(
+        self,
+        search_path: Path,
+        pattern: str,
+        name_re: re.Pattern[str] | None,
+        max_depth: int,
+        file_type: str,
+        include_hidden: bool,
+    ) -> Iterator[DirEntryRecord]:
+        literal = _fold_case(pattern)
+
+        def name_matches(name: str) -> bool:
+            if name_re is None:
+                return _fold_case(name) == literal
+            return name_re.match(name) is not None
+
+        # Explicit DFS over sorted directory listings: preserves the pre-order
+        # of the old recursive walk while pruning before a directory is opened.
+        stack: list[tuple[Iterator[DirEntryRecord], int]] = [
+            (self._scan_sorted(str(search_path)), 0)
+        ]
+        while stack:
+            entries, depth = stack[-1]
+            if (entry := next(entries, None)) is None:
+                stack.pop()
+                continue
+
+            name = entry.name
+            if not include_hidden and name.startswith("."):
+                continue
+            if self._should_exclude(name):
+                continue
+
+            is_dir = entry.is_dir
+            if self._type_matches(file_type, is_dir) and name_matches(name):
+                yield entry
+
+            if is_dir and depth < max_depth and not entry.is_symlink:
+                stack.append((self._scan_sorted(entry.path), depth + 1))
+
+    def _find_literal_path(
+        self,
+        search_path: Path,
+        pattern: str,
+        max_depth: int,
+        file_type: str,
+        include_hidden: bool,
+    ) -> list[FileMatch]:
+        # A wildcard-free pattern with a separator names exactly one path, so
+        # a single stat() replaces the walk. The walk's filters still apply to
+        # every component.
+        rel = Path(pattern)
+        if rel.is_absolute() or ".." in rel.parts or len(rel.parts) - 1 > max_depth:
+            return []
+        if any(
+            (not include_hidden and part.startswith(".")) or self._should_exclude(part)
+            for part in rel.parts
+        ):
+            return []
+
+        candidate = search_path / rel
+        try:
+            st = candidate.stat()
+        except OSError:
+            return []
+
+        is_dir = stat.S_ISDIR(st.st_mode)
+        if not self._type_matches(file_type, is_dir):
+            return []
+
+        return [
+            FileMatch(
+                path=str(candidate.relative_to(self.config.effective_workdir)),
+                name=candidate.name,
+                is_dir=is_dir,
+                size=None if is_dir else st.st_size,
+            )
+        ]
+
+    @staticmethod
+    def _type_matches(file_type: str, is_dir: bool) -> bool:
+        return (
+            file_type == "any"
+            or (file_type == "file" and not is_dir)
+            or (file_type == "directory" and is_dir)
+        )
 
-            if depth > max_depth:
-                return True
-            if len(matches) >= self.config.max_results:
-                was_truncated = True
-                return False
+    def _scan_sorted(self, path: str) -> Iterator[DirEntryRecord]:
+        try:
+            return iter(self.state.listing_cache.entries(path))
+        except OSError:
+            return iter(())
 
+    def _to_match(self, entry: DirEntryRecord) -> FileMatch:
+        is_dir = entry.is_dir
+        size = None
+        if not is_dir:
             try:
-                for item in sorted(
-                    current_path.iterdir(), key=lambda x: x.name.lower()
-                ):
-                    if len(matches) >= self.config.max_results:
-                        was_truncated = True
-                        return False
-
-                    if self._should_exclude(item):
-                        continue
-
-                    if not include_hidden and item.name.startswith("."):
-                        continue
-
-                    is_dir = item.is_dir()
-
-                    type_match = (
-                        file_type == "any"
-                        or (file_type == "file" and not is_dir)
-                        or (file_type == "directory" and is_dir)
-                    )
-
-                    if fnmatch.fnmatch(item.name, pattern) and type_match:
-                        try:
-                            size = item.stat().st_size if not is_dir else None
-                        except OSError:
-                            size = None
-
-                        rel_path = str(item.relative_to(self.config.effective_workdir))
-                        matches.append(
-                            FileMatch(
-                                path=rel_path, name=item.name, is_dir=is_dir, size=size
-                            )
-                        )
-
-                    if is_dir:
-                        if not search_recursive(item, depth + 1):
-                            return False
-
-            except PermissionError:
-                pass
+                size = os.stat(entry.path).st_size
             except OSError:
                 pass
 
-            return True
-
-        search_recursive(search_path, 0)
-        return matches, was_truncated
+        rel_path = Path(entry.path).relative_to(self.config.effective_workdir)
+        return FileMatch(path=str(rel_path), name=entry.name, is_dir=is_dir, size=size)
 
     @classmethod
     def get_call_display(cls, event: ToolCallEvent) -> ToolCallDisplay:
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import asyncio
+from dataclasses import dataclass, field
+import os
 from pathlib import Path
 from typing import TYPE_CHECKING, ClassVar, final
 
@@ -13,7 +15,10 @@ if TYPE_CHECKING:
     from vibe.core.types import ToolCallEvent, ToolResultEvent
 
 
-class GitFileStatus(BaseModel):
+# One per changed path in git's porcelain output, built from already-parsed
+# values, so a slotted dataclass rather than a validated model.
+@dataclass(slots=True)
+class GitFileStatus:
     path: str
     status: str  # "modified", "added", "deleted", "renamed", "untracked"
     staged: bool = False
@@ -50,7 +55,30 @@ class GitStatusState(BaseToolState):
 
 MAX_STATUS_DISPLAY = 10
 MAX_UNTRACKED_DISPLAY = 5
-MIN_SPLIT_PARTS = 2
+
+_READ_CHUNK = 64 * 1024
+_UNTRACKED_RECORD = b"\0? "
+
+_STATUS_NAMES = {
+    "M": "modified",
+    "A": "added",
+    "D": "deleted",
+    "R": "renamed",
+    "C": "copied",
+}
+_STATUS_ICONS = {"added": "➕", "deleted": "➖", "modified": "✏️"}
+
+
+@dataclass(slots=True)
+class _PorcelainStatus:
+    branch: str | None = None
+    ahead: int = 0
+    behind: int = 0
+    staged: list[GitFileStatus] = field(default_factory=list)
+    unstaged: list[GitFileStatus] = field(default_factory=list)
+    untracked: list[str] = field(default_factory=list)
+    stash_count: int = 0
+    has_conflicts: bool = False
 
 
 class GitStatus(
@@ -66,121 +94,144 @@ class GitStatus(
     async def run(self, args: GitStatusArgs) -> GitStatusResult:
         workdir = self.config.effective_workdir
 
-        is_git = await self._is_git_repo(workdir)
-        if not is_git:
+        untracked_mode = "all" if args.include_untracked else "no"
+        cmd = [
+            "status",
+            "--porcelain=v2",
+            "--branch",
+            "-z",
+            f"--untracked-files={untracked_mode}",
+        ]
+        if args.show_stash:
+            cmd.append("--show-stash")
+
+        # Outside a repository `git status` fails, which doubles as the
+        # repository check.
+        out, code = await self._read_status(workdir, cmd, self.config.max_files)
+        if code != 0:
             return GitStatusResult(is_git_repo=False, summary="Not a git repository")
 
-        branch, ahead, behind = await self._get_branch_info(workdir)
-        staged = await self._get_staged_files(workdir)
-        unstaged = await self._get_unstaged_files(workdir)
-        untracked = (
-            await self._get_untracked_files(workdir) if args.include_untracked else []
-        )
-        stash_count = await self._get_stash_count(workdir) if args.show_stash else 0
-        has_conflicts = await self._has_conflicts(workdir)
-
-        staged = staged[: self.config.max_files]
-        unstaged = unstaged[: self.config.max_files]
-        untracked = untracked[: self.config.max_files]
+        status = self._parse_porcelain_v2(out)
+        staged = status.staged[: self.config.max_files]
+        unstaged = status.unstaged[: self.config.max_files]
+        untracked = status.untracked[: self.config.max_files]
 
         summary = self._generate_summary(
-            branch, staged, unstaged, untracked, ahead, behind
+            status.branch, staged, unstaged, untracked, status.ahead, status.behind
         )
 
         return GitStatusResult(
             is_git_repo=True,
-            branch=branch,
-            ahead=ahead,
-            behind=behind,
+            branch=status.branch,
+            ahead=status.ahead,
+            behind=status.behind,
             staged=staged,
             unstaged=unstaged,
             untracked=untracked,
-            stash_count=stash_count,
-            has_conflicts=has_conflicts,
+            stash_count=status.stash_count,
+            has_conflicts=status.has_conflicts,
             summary=summary,
         )
 
-    async def _run_git(self, workdir: Path, *args: str) -> tuple[str, int]:
+    async def _read_status(
+        self, workdir: Path, cmd: list[str], max_untracked: int
+    ) -> tuple[str, int]:
+        # Untracked records come after every header and tracked entry, so once
+        # one more than max_untracked has started, everything that will be
+        # reported has been read and git can be stopped instead of listing the
+        # rest of a large untracked tree.
         proc = await asyncio.create_subprocess_exec(
             "git",
-            *args,
+            *cmd,
             cwd=workdir,
             stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        stdout, _ = await proc.communicate()
-        return stdout.decode("utf-8", errors="replace").strip(), proc.returncode or 0
-
-    async def _is_git_repo(self, workdir: Path) -> bool:
-        _, code = await self._run_git(workdir, "rev-parse", "--git-dir")
-        return code == 0
-
-    async def _get_branch_info(self, workdir: Path) -> tuple[str | None, int, int]:
-        branch_out, _ = await self._run_git(workdir, "branch", "--show-current")
-        branch = branch_out or None
-
-        ahead, behind = 0, 0
-        if branch:
-            status_out, _ = await self._run_git(
-                workdir,
-                "rev-list",
-                "--left-right",
-                "--count",
-                f"{branch}@{{upstream}}...HEAD",
-            )
-            if status_out and "\t" in status_out:
-                parts = status_out.split("\t")
-                behind = int(parts[0]) if parts[0].isdigit() else 0
-                ahead = int(parts[1]) if len(parts) > 1 and parts[1].isdigit() else 0
-
-        return branch, ahead, behind
-
-    async def _get_staged_files(self, workdir: Path) -> list[GitFileStatus]:
-        out, _ = await self._run_git(workdir, "diff", "--cached", "--name-status")
-        return self._parse_status_output(out, staged=True)
-
-    async def _get_unstaged_files(self, workdir: Path) -> list[GitFileStatus]:
-        out, _ = await self._run_git(workdir, "diff", "--name-status")
-        return self._parse_status_output(out, staged=False)
-
-    async def _get_untracked_files(self, workdir: Path) -> list[str]:
-        out, _ = await self._run_git(
-            workdir, "ls-files", "--others", "--exclude-standard"
+            stderr=asyncio.subprocess.DEVNULL,
+            # A read-only status must not take index.lock to refresh the
+            # index, or it can make the user's own git commands fail.
+            env={**os.environ, "GIT_OPTIONAL_LOCKS": "0"},
         )
-        return [f for f in out.splitlines() if f]
-
-    async def _get_stash_count(self, workdir: Path) -> int:
-        out, _ = await self._run_git(workdir, "stash", "list")
-        return len(out.splitlines()) if out else 0
-
-    async def _has_conflicts(self, workdir: Path) -> bool:
-        out, _ = await self._run_git(workdir, "diff", "--name-only", "--diff-filter=U")
-        return bool(out.strip())
-
-    def _parse_status_output(self, output: str, staged: bool) -> list[GitFileStatus]:
-        status_map = {
-            "M": "modified",
-            "A": "added",
-            "D": "deleted",
-            "R": "renamed",
-            "C": "copied",
-            "U": "conflict",
-        }
-        files = []
-        for line in output.splitlines():
-            if not line:
+        assert proc.stdout is not None
+        out = bytearray()
+        untracked = 0
+        stopped = False
+        while not stopped and (chunk := await proc.stdout.read(_READ_CHUNK)):
+            pos = max(len(out) - len(_UNTRACKED_RECORD) + 1, 0)
+            out += chunk
+            while (pos := out.find(_UNTRACKED_RECORD, pos)) >= 0:
+                untracked += 1
+                if untracked > max_untracked:
+                    del out[pos + 1 :]
+                    proc.kill()
+                    stopped = True
+                    break
+                pos += len(_UNTRACKED_RECORD)
+
+        code = await proc.wait()
+        return out.decode("utf-8", errors="replace"), 0 if stopped else code
+
+    def _parse_porcelain_v2(self, output: str) -> _PorcelainStatus:
+        # Every record is NUL-terminated. Headers are "# <key> <value>"; changed
+        # entries are "1 XY <6 fields> <path>", renames and copies
+        # "2 XY <7 fields> <path>" followed by the original path as its own
+        # record, unmerged entries "u XY <8 fields> <path>" and untracked
+        # entries "? <path>". X is the index side, Y the worktree side, and
+        # "." means unchanged.
+        status = _PorcelainStatus()
+        records = iter(output.split("\0"))
+        for record in records:
+            kind = record[:1]
+            if kind == "1":
+                xy, path = record[2:4], record.split(" ", 8)[-1]
+            elif kind == "2":
+                xy, path = record[2:4], record.split(" ", 9)[-1]
+                next(records, "")
+            elif kind == "u":
+                path = record.split(" ", 10)[-1]
+                status.has_conflicts = True
+                status.staged.append(
+                    GitFileStatus(path=path, status="conflict", staged=True)
+                )
+                status.unstaged.append(
+                    GitFileStatus(path=path, status="conflict", staged=False)
+                )
+                continue
+            elif kind == "?":
+                status.untracked.append(record[2:])
+                continue
+            elif kind == "#":
+                self._parse_header(record, status)
+                continue
+            else:
                 continue
-            parts = line.split("\t", 1)
-            if len(parts) >= MIN_SPLIT_PARTS:
-                status_char = parts[0][0] if parts[0] else "M"
-                files.append(
+
+            if xy[0] != ".":
+                status.staged.append(
                     GitFileStatus(
-                        path=parts[1],
-                        status=status_map.get(status_char, "unknown"),
-                        staged=staged,
+                        path=path,
+                        status=_STATUS_NAMES.get(xy[0], "unknown"),
+                        staged=True,
                     )
                 )
-        return files
+            if xy[1] != ".":
+                status.unstaged.append(
+                    GitFileStatus(
+                        path=path,
+                        status=_STATUS_NAMES.get(xy[1], "unknown"),
+                        staged=False,
+                    )
+                )
+        return status
+
+    def _parse_header(self, record: str, status: _PorcelainStatus) -> None:
+        _, key, value = record.split(" ", 2)
+        if key == "branch.head":
+            status.branch = None if value == "(detached)" else value
+        elif key == "branch.ab":
+            ahead, _, behind = value.partition(" ")
+            status.ahead = int(ahead.lstrip("+"))
+            status.behind = int(behind.lstrip("-"))
+        elif key == "stash":
+            status.stash_count = int(value)
 
     def _generate_summary(
         self,
@@ -233,44 +284,41 @@ class GitStatus(
             return ToolResultDisplay(success=True, message="Not a git repository")
 
         lines = [f"🌿 {result.summary}"]
-
-        if result.staged:
-            lines.append("\n📦 Staged:")
-            for f in result.staged[:MAX_STATUS_DISPLAY]:
-                icon = {"added": "➕", "deleted": "➖", "modified": "✏️"}.get(
-                    f.status, "•"
-                )
-                lines.append(f"  {icon} {f.path}")
-            if len(result.staged) > MAX_STATUS_DISPLAY:
-                lines.append(
-                    f"  ... and {len(result.staged) - MAX_STATUS_DISPLAY} more"
-                )
-
-        if result.unstaged:
-            lines.append("\n📝 Unstaged:")
-            for f in result.unstaged[:MAX_STATUS_DISPLAY]:
-                icon = {"added": "➕", "deleted": "➖", "modified": "✏️"}.get(
-                    f.status, "•"
-                )
-                lines.append(f"  {icon} {f.path}")
-            if len(result.unstaged) > MAX_STATUS_DISPLAY:
-                lines.append(
-                    f"  ... and {len(result.unstaged) - MAX_STATUS_DISPLAY} more"
-                )
-
-        if result.untracked:
-            lines.append("\n❓ Untracked:")
-            for f in result.untracked[:MAX_UNTRACKED_DISPLAY]:
-                lines.append(f"  • {f}")
-            if len(result.untracked) > MAX_UNTRACKED_DISPLAY:
-                lines.append(
-                    f"  ... and {len(result.untracked) - MAX_UNTRACKED_DISPLAY} more"
-                )
+        for title, files in (
+            ("📦 Staged", result.staged),
+            ("📝 Unstaged", result.unstaged),
+        ):
+            cls._append_section(
+                lines,
+                title,
+                [
+                    f"{_STATUS_ICONS.get(f.status, '•')} {f.path}"
+                    for f in files[:MAX_STATUS_DISPLAY]
+                ],
+                len(files),
+            )
+        cls._append_section(
+            lines,
+            "❓ Untracked",
+            [f"• {path}" for path in result.untracked[:MAX_UNTRACKED_DISPLAY]],
+            len(result.untracked),
+        )
 
         return ToolResultDisplay(
             success=True, message=result.summary, details={"output": "\n".join(lines)}
         )
 
+    @staticmethod
+    def _append_section(
+        lines: list[str], title: str, shown: list[str], total: int
+    ) -> None:
+        if not total:
+            return
+        lines.append(f"\n{title}:")
+        lines.extend(f"  {item}" for item in shown)
+        if total > len(shown):
+            lines.append(f"  ... and {total - len(shown)} more")
+
     @classmethod
     def get_status_text(cls) -> str:
         return "Checking git status"
@@ -1,16 +1,13 @@
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Sequence
+from dataclasses import dataclass
+import itertools
 import os
 from pathlib import Path
 from typing import TYPE_CHECKING, ClassVar, final
 
-try:
-    import aerofs
-
-    HAS_AEROFS = True
-except ImportError:
-    HAS_AEROFS = False
-
 from pydantic import BaseModel, Field
 
 from vibe.core.tools.base import (
@@ -20,13 +17,17 @@ from vibe.core.tools.base import (
     ToolError,
     ToolPermission,
 )
+from vibe.core.tools.dir_cache import DirEntryRecord, DirListingCache
 from vibe.core.tools.ui import ToolCallDisplay, ToolResultDisplay, ToolUIData
 
 if TYPE_CHECKING:
     from vibe.core.types import ToolCallEvent, ToolResultEvent
 
 
-class DirEntry(BaseModel):
+# One per listed entry, built from filesystem values, so a slotted dataclass
+# rather than a validated model.
+@dataclass(slots=True)
+class DirEntry:
     name: str
     is_dir: bool
     size: int | None = None
@@ -63,7 +64,13 @@ class ListDirToolConfig(BaseToolConfig):
 
 
 class ListDirState(BaseToolState):
-    pass
+    listing_cache: DirListingCache = Field(
+        default_factory=DirListingCache, exclude=True
+    )
+
+
+_KB = 1024
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
 
 
 class ListDir(
@@ -111,36 +118,40 @@ class ListDir(
 
     async def _list_directory(
         self, dir_path: Path, max_depth: int, include_hidden: bool
+    ) -> tuple[list[DirEntry], bool]:
+        # The per-entry is_dir/stat/iterdir calls block, so run the whole
+        # listing in a worker thread rather than just the initial listdir.
+        return await asyncio.to_thread(
+            self._list_directory_sync, dir_path, max_depth, include_hidden
+        )
+
+    def _list_directory_sync(
+        self, dir_path: Path, max_depth: int, include_hidden: bool
     ) -> tuple[list[DirEntry], bool]:
         entries: list[DirEntry] = []
-        was_truncated = False
 
         try:
-            if HAS_AEROFS:
-                items = await aerofs.os.listdir(str(dir_path))  # type: ignore
-            else:
-                import asyncio
-
-                items = await asyncio.to_thread(os.listdir, dir_path)
-
-            items.sort(key=lambda x: (not Path(dir_path / x).is_dir(), x.lower()))
-
-            for item in items:
-                if len(entries) >= self.config.max_entries:
-                    was_truncated = True
-                    break
-
-                if not include_hidden and item.startswith("."):
-                    continue
-
-                item_path = dir_path / item
-                is_dir = item_path.is_dir()
+            cache = self.state.listing_cache
+            records: Sequence[DirEntryRecord] = cache.entries(str(dir_path))
+            if not include_hidden:
+                records = [r for r in records if not r.name.startswith(".")]
+
+            # Listings come back sorted by name, so directories-first is a
+            # stable partition rather than a sort, and only the entries that
+            # fit within max_entries (plus one to detect truncation) are taken.
+            ordered = itertools.chain(
+                (r for r in records if r.is_dir), (r for r in records if not r.is_dir)
+            )
+            selected = list(itertools.islice(ordered, self.config.max_entries + 1))
+            was_truncated = len(selected) > self.config.max_entries
 
+            for item in selected[: self.config.max_entries]:
+                is_dir = item.is_dir
                 entry = DirEntry(
-                    name=item,
+                    name=item.name,
                     is_dir=is_dir,
-                    size=item_path.stat().st_size if not is_dir else None,
-                    children_count=len(list(item_path.iterdir())) if is_dir else None,
+                    size=os.stat(item.path).st_size if not is_dir else None,
+                    children_count=cache.count(item.path) if is_dir else None,
                 )
                 entries.append(entry)
 
@@ -200,13 +211,11 @@ class ListDir(
 
     @staticmethod
     def _format_size(size: int) -> str:
-        size_f = float(size)
-        kb = 1024
-        for unit in ["B", "KB", "MB", "GB"]:
-            if size_f < kb:
-                return f"{int(size_f)}{unit}" if unit == "B" else f"{size_f:.1f}{unit}"
-            size_f /= kb
-        return f"{size_f:.1f}TB"
+        if size < _KB:
+            return f"{size}B"
+        # Each unit is 2**10 of the previous one, so the bit length picks it.
+        unit = min((size.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+        return f"{size / (1 << (10 * unit)):.1f}{_SIZE_UNITS[unit]}"
 
     @classmethod
     def get_status_text(cls) -> str:
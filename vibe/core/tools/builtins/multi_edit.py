@@ -1,10 +1,16 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass, field
 from enum import StrEnum
+from functools import cached_property
 import hashlib
+import itertools
+import os
 from pathlib import Path
 import re
+import shutil
+import tempfile
 from typing import TYPE_CHECKING, ClassVar, Literal, final
 
 try:
@@ -15,11 +21,6 @@ except ImportError:
     HAS_RAPIDFUZZ = False
     fuzz = None
 
-try:
-    import aerofs as aiofiles
-except ImportError:
-    import aiofiles  # type: ignore[no-redef]
-
 from pydantic import BaseModel, Field
 
 from vibe.core.tools.base import BaseTool, BaseToolConfig, BaseToolState, ToolPermission
@@ -55,6 +56,10 @@ class EditBlock(BaseModel):
         default=None, description="End of search range (1-indexed)."
     )
 
+    @cached_property
+    def stripped_search_lines(self) -> tuple[str, ...]:
+        return tuple(line.strip() for line in self.search.splitlines())
+
 
 class FileEdit(BaseModel):
     path: str = Field(description="Path to the file to edit.")
@@ -64,7 +69,11 @@ class FileEdit(BaseModel):
     )
 
 
-class MatchResult(BaseModel):
+# Built several times per edit while falling through the matching tiers, so a
+# plain slotted dataclass rather than a validated model; pydantic still
+# serializes it as part of EditBlockResult.
+@dataclass(slots=True)
+class MatchResult:
     success: bool
     tier: MatchTier
     confidence: float
@@ -74,7 +83,10 @@ class MatchResult(BaseModel):
     suggestion: str | None = None
 
 
-class EditBlockResult(BaseModel):
+# One per edit and only ever built here from already-typed values, so it is a
+# slotted dataclass like MatchResult; FileEditResult serializes it the same way.
+@dataclass(slots=True)
+class EditBlockResult:
     edit_index: int
     success: bool
     match_result: MatchResult
@@ -137,21 +149,34 @@ class MultiEditResult(BaseModel):
 @dataclass
 class MatchContext:
     content: str
-    lines: list[str]
     min_confidence: float
 
+    @cached_property
+    def lines(self) -> list[str]:
+        # Only the fallback tiers work line by line; an exact hit never
+        # needs the split.
+        return self.content.splitlines(keepends=True)
+
+    @cached_property
+    def stripped_lines(self) -> list[str]:
+        return [line.strip() for line in self.lines]
+
+    @cached_property
+    def line_offsets(self) -> list[int]:
+        # line_offsets[i] is where line i starts; the final entry is the end
+        # of the content, so any line range maps to a slice in O(1).
+        return [0, *itertools.accumulate(map(len, self.lines))]
+
 
 class MatchingEngine:
     @classmethod
     def match(
         cls, content: str, edit: EditBlock, min_confidence: float = 0.85
     ) -> MatchResult:
-        ctx = MatchContext(
-            content=content,
-            lines=content.splitlines(keepends=True),
-            min_confidence=min_confidence,
-        )
+        return cls.match_in(MatchContext(content, min_confidence), edit)
 
+    @classmethod
+    def match_in(cls, ctx: MatchContext, edit: EditBlock) -> MatchResult:
         result = cls._tier1_exact(ctx, edit)
         if result.success:
             return result
@@ -188,58 +213,58 @@ class MatchingEngine:
 
     @classmethod
     def _tier2_normalized(cls, ctx: MatchContext, edit: EditBlock) -> MatchResult:
-        search_lines = edit.search.splitlines()
-        search_stripped = [line.strip() for line in search_lines]
-
-        for i, line in enumerate(ctx.lines):
-            if line.strip() == search_stripped[0]:
-                match_found = True
-                for j, expected in enumerate(search_stripped):
-                    if i + j >= len(ctx.lines):
-                        match_found = False
-                        break
-                    if ctx.lines[i + j].strip() != expected:
-                        match_found = False
-                        break
-
-                if match_found:
-                    start = sum(len(l) for l in ctx.lines[:i])
-                    end = sum(len(l) for l in ctx.lines[: i + len(search_lines)])
-
-                    return MatchResult(
-                        success=True,
-                        tier=MatchTier.NORMALIZED,
-                        confidence=0.95,
-                        match_start=start,
-                        match_end=end,
-                        warning="Matched via whitespace normalization",
-                    )
+        search_stripped = list(edit.stripped_search_lines)
+        stripped = ctx.stripped_lines
+        count = len(search_stripped)
+
+        # list.index finds each candidate first line in C; only those get the
+        # full comparison, itself a single list equality.
+        i = -1
+        while True:
+            try:
+                i = stripped.index(search_stripped[0], i + 1)
+            except ValueError:
+                break
+            if stripped[i : i + count] == search_stripped:
+                return MatchResult(
+                    success=True,
+                    tier=MatchTier.NORMALIZED,
+                    confidence=0.95,
+                    match_start=ctx.line_offsets[i],
+                    match_end=ctx.line_offsets[i + count],
+                    warning="Matched via whitespace normalization",
+                )
 
         return MatchResult(success=False, tier=MatchTier.NORMALIZED, confidence=0.0)
 
     @classmethod
     def _tier3_anchored(cls, ctx: MatchContext, edit: EditBlock) -> MatchResult:
-        pattern_parts = []
-        if edit.context_before:
-            pattern_parts.append(re.escape(edit.context_before.strip()))
-        pattern_parts.append(re.escape(edit.search))
-        if edit.context_after:
-            pattern_parts.append(re.escape(edit.context_after.strip()))
-
-        pattern = r"\s*".join(pattern_parts)
-
-        match = re.search(pattern, ctx.content, re.MULTILINE | re.DOTALL)
-        if match:
-            search_start = ctx.content.find(edit.search, match.start())
-            if search_start != -1 and search_start <= match.end():
+        # The search text must appear verbatim, so only its occurrences are
+        # candidates; each is accepted if the context lines sit next to it
+        # with nothing but whitespace in between.
+        content = ctx.content
+        before = edit.context_before.strip() if edit.context_before else ""
+        after = edit.context_after.strip() if edit.context_after else ""
+
+        start = content.find(edit.search)
+        while start != -1:
+            end = start + len(edit.search)
+            head = start
+            while head and content[head - 1].isspace():
+                head -= 1
+            tail = end
+            while tail < len(content) and content[tail].isspace():
+                tail += 1
+            if content.endswith(before, 0, head) and content.startswith(after, tail):
                 return MatchResult(
                     success=True,
                     tier=MatchTier.ANCHORED,
                     confidence=0.90,
-                    match_start=search_start,
-                    match_end=search_start + len(edit.search),
+                    match_start=start,
+                    match_end=end,
                     warning="Matched via context anchoring",
                 )
+            start = content.find(edit.search, start + 1)
 
         return MatchResult(success=False, tier=MatchTier.ANCHORED, confidence=0.0)
 
@@ -256,18 +281,16 @@ class MatchingEngine:
                 warning=f"Line range {start_line + 1}-{end_line} out of bounds",
             )
 
-        range_lines = ctx.lines[start_line:end_line]
-        range_content = "".join(range_lines)
-
-        idx = range_content.find(edit.search)
+        # An inverted range is empty, as the old line slice would have been.
+        range_start = ctx.line_offsets[min(start_line, end_line)]
+        idx = ctx.content.find(edit.search, range_start, ctx.line_offsets[end_line])
         if idx != -1:
-            offset = sum(len(l) for l in ctx.lines[:start_line])
             return MatchResult(
                 success=True,
                 tier=MatchTier.LINE_RANGE,
                 confidence=0.85,
-                match_start=offset + idx,
-                match_end=offset + idx + len(edit.search),
+                match_start=idx,
+                match_end=idx + len(edit.search),
                 warning=f"Matched in line range {start_line + 1}-{end_line}",
             )
 
@@ -284,30 +307,23 @@ class MatchingEngine:
             )
         assert fuzz is not None
 
-        best_score = 0.0
-        best_match = ""
-        best_pos = -1
-
-        search_len = len(edit.search)
-
-        for i in range(len(ctx.content) - min(search_len, 10)):
-            window = ctx.content[i : i + search_len + 50]
-            score = fuzz.ratio(edit.search, window[:search_len]) / 100.0
-
-            if score > best_score:
-                best_score = score
-                best_match = window[:search_len]
-                best_pos = i
-
-        if best_score >= FUZZY_MATCH_THRESHOLD:
+        # partial_ratio scores the search against every same-length window
+        # of the file in one native pass, and the cutoff lets it skip windows
+        # that cannot reach the threshold.
+        alignment = fuzz.partial_ratio_alignment(
+            edit.search, ctx.content, score_cutoff=FUZZY_MATCH_THRESHOLD * 100
+        )
+        if alignment is not None:
+            score = alignment.score / 100.0
+            start, end = alignment.dest_start, alignment.dest_end
             return MatchResult(
                 success=False,  # Never auto-apply fuzzy
                 tier=MatchTier.FUZZY,
-                confidence=best_score,
-                match_start=best_pos,
-                match_end=best_pos + len(best_match),
-                warning=f"Fuzzy match found ({best_score:.0%} confidence) - manual review required",
-                suggestion=best_match,
+                confidence=score,
+                match_start=start,
+                match_end=end,
+                warning=f"Fuzzy match found ({score:.0%} confidence) - manual review required",
+                suggestion=ctx.content[start:end],
             )
 
         return MatchResult(
@@ -323,23 +339,29 @@ class SafetyChecker:
     async def check_all(cls, workdir: Path) -> tuple[bool, list[str]]:
         errors: list[str] = []
 
-        merge_head = workdir / ".git" / "MERGE_HEAD"
-        if merge_head.exists():
+        # One read of .git answers every probe below; a missing .git, or a
+        # worktree's .git file, simply has none of the markers.
+        try:
+            with os.scandir(workdir / ".git") as it:
+                git_entries = {entry.name for entry in it}
+        except OSError:
+            git_entries = set()
+
+        if "MERGE_HEAD" in git_entries:
             errors.append("Git merge in progress. Resolve before editing.")
 
-        rebase_dir = workdir / ".git" / "rebase-merge"
-        rebase_apply = workdir / ".git" / "rebase-apply"
-        if rebase_dir.exists() or rebase_apply.exists():
+        if "rebase-merge" in git_entries or "rebase-apply" in git_entries:
             errors.append("Git rebase in progress. Complete or abort first.")
 
-        index_lock = workdir / ".git" / "index.lock"
-        if index_lock.exists():
+        if "index.lock" in git_entries:
             errors.append("Git index is locked. Another git process may be running.")
 
         return len(errors) == 0, errors
 
 
 class DiffGenerator:
+    _HUNK_HEADER_RE = re.compile(r"^@@ -(\d+)(,\d+)? \+(\d+)(,\d+)? @@$", re.MULTILINE)
+
     @classmethod
     def generate(
         cls, original: str, modified: str, path: str, context_lines: int = 3
@@ -349,15 +371,45 @@ class DiffGenerator:
         orig_lines = original.splitlines(keepends=True)
         mod_lines = modified.splitlines(keepends=True)
 
-        diff = difflib.unified_diff(
-            orig_lines,
-            mod_lines,
-            fromfile=f"a/{path}",
-            tofile=f"b/{path}",
-            n=context_lines,
+        # Lines shared at both ends can never be part of a change, so hand
+        # difflib only the differing middle plus its context and shift the
+        # hunk line numbers back afterwards.
+        prefix, suffix = cls._common_affixes(orig_lines, mod_lines)
+        skip = max(0, prefix - context_lines)
+        tail = max(0, suffix - context_lines)
+
+        diff = "".join(
+            difflib.unified_diff(
+                orig_lines[skip : len(orig_lines) - tail],
+                mod_lines[skip : len(mod_lines) - tail],
+                fromfile=f"a/{path}",
+                tofile=f"b/{path}",
+                n=context_lines,
+            )
+        )
+        if not skip:
+            return diff
+
+        return cls._HUNK_HEADER_RE.sub(
+            lambda m: (
+                f"@@ -{int(m[1]) + skip}{m[2] or ''} +{int(m[3]) + skip}{m[4] or ''} @@"
+            ),
+            diff,
         )
 
-        return "".join(diff)
+    @staticmethod
+    def _common_affixes(a: list[str], b: list[str]) -> tuple[int, int]:
+        limit = min(len(a), len(b))
+        prefix = 0
+        while prefix < limit and a[prefix] == b[prefix]:
+            prefix += 1
+
+        limit -= prefix
+        suffix = 0
+        while suffix < limit and a[-1 - suffix] == b[-1 - suffix]:
+            suffix += 1
+
+        return prefix, suffix
 
 
 @dataclass
@@ -366,40 +418,106 @@ class EditTransaction:
     original_contents: dict[Path, str] = field(default_factory=dict)
     backup_paths: dict[Path, Path] = field(default_factory=dict)
     modified_contents: dict[Path, str] = field(default_factory=dict)
+    pending_contents: dict[Path, str] = field(default_factory=dict)
 
     async def read_file(self, path: Path) -> str:
-        async with aiofiles.open(path, encoding="utf-8") as f:
-            content = await f.read()
+        # Files are capped at max_file_size, so a single worker-thread read
+        # beats an async file object, which hops to a thread for the open,
+        # the read and the close separately.
+        content = await asyncio.to_thread(path.read_text, encoding="utf-8")
         self.original_contents[path] = content
         return content
 
     def compute_hash(self, content: str) -> str:
-        return hashlib.md5(content.encode("utf-8")).hexdigest()
+        # A change-detection checksum over content already in memory; it is
+        # not used for security, which also keeps it available on FIPS builds.
+        return hashlib.md5(content.encode("utf-8"), usedforsecurity=False).hexdigest()
 
     async def create_backup(self, path: Path) -> Path:
         backup_path = path.with_suffix(path.suffix + ".bak")
-
-        async with aiofiles.open(path, encoding="utf-8") as f:
-            content = await f.read()
-
-        async with aiofiles.open(backup_path, "w", encoding="utf-8") as f:
-            await f.write(content)
-
+        await asyncio.to_thread(self._link_or_copy, path, backup_path)
         self.backup_paths[path] = backup_path
         return backup_path
 
+    @staticmethod
+    def _link_or_copy(src: Path, dst: Path) -> None:
+        # apply() renames a new file over the original rather than rewriting
+        # it, so the original inode is never modified and a hard link to it is
+        # a complete backup. Fall back to a copy where links are unsupported.
+        dst.unlink(missing_ok=True)
+        try:
+            dst.hardlink_to(src)
+        except OSError:
+            shutil.copy2(src, dst)
+
     async def apply(self, path: Path, content: str) -> None:
-        async with aiofiles.open(path, "w", encoding="utf-8") as f:
-            await f.write(content)
+        await self._write_atomic(path, content, self.backup_paths.get(path))
         self.modified_contents[path] = content
 
+    async def commit(self, create_backup: bool) -> None:
+        async def write(path: Path, content: str) -> None:
+            if create_backup:
+                await self.create_backup(path)
+            await self.apply(path, content)
+
+        # Let every write settle before surfacing a failure, so a rollback
+        # never races a write that is still in flight.
+        outcomes = await asyncio.gather(
+            *(write(path, content) for path, content in self.pending_contents.items()),
+            return_exceptions=True,
+        )
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                raise outcome
+
     async def rollback(self, path: Path) -> bool:
         if path in self.original_contents:
-            async with aiofiles.open(path, "w", encoding="utf-8") as f:
-                await f.write(self.original_contents[path])
+            await self._write_atomic(path, self.original_contents[path])
             return True
         return False
 
+    @staticmethod
+    async def _write_atomic(
+        path: Path, content: str, backup: Path | None = None
+    ) -> None:
+        # Write a sibling temp file and rename it over the target so the file
+        # is never observed half-written, even if the write fails midway.
+        # Files that must keep their inode are the exception, see below.
+        await asyncio.to_thread(
+            EditTransaction._write_atomic_sync, path, content, backup
+        )
+
+    @staticmethod
+    def _write_atomic_sync(path: Path, content: str, backup: Path | None) -> None:
+        fd, tmp_name = tempfile.mkstemp(
+            dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+        )
+        tmp_st = os.fstat(fd)
+        os.close(fd)
+        tmp_path = Path(tmp_name)
+        try:
+            st = path.stat()
+            linked_backup = backup is not None and os.path.samestat(st, backup.stat())
+            same_owner = (st.st_uid, st.st_gid) == (tmp_st.st_uid, tmp_st.st_gid)
+            # A rename gives the path a new inode, which would cut it off from
+            # its other hard links and hand it our owner and group. Such files
+            # are rewritten in place instead, after turning a linked backup
+            # into a real copy so it keeps the original text.
+            if st.st_nlink - linked_backup > 1 or not same_owner:
+                tmp_path.unlink()
+                if backup is not None and linked_backup:
+                    backup.unlink()
+                    shutil.copy2(path, backup)
+                path.write_text(content, encoding="utf-8")
+                return
+
+            tmp_path.write_text(content, encoding="utf-8")
+            shutil.copymode(path, tmp_path)
+            tmp_path.replace(path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
     async def rollback_all(self) -> int:
         count = 0
         for path in self.modified_contents:
@@ -455,15 +573,11 @@ class MultiEdit(
         reject_files: dict[str, str] = {}
 
         try:
-            for file_edit in args.files:
-                file_result = await self._process_file(
-                    file_edit=file_edit,
-                    transaction=transaction,
-                    args=args,
-                    workdir=workdir,
-                )
-                results.append(file_result)
+            results = await self._check_files(args, transaction, workdir)
 
+            for i, (file_edit, file_result) in enumerate(
+                zip(args.files, results, strict=True)
+            ):
                 edits_applied += file_result.edits_applied
                 edits_failed += file_result.edits_failed
 
@@ -471,22 +585,26 @@ class MultiEdit(
                     reject_files[file_edit.path] = file_result.reject_content
 
                 if not file_result.success and args.fail_fast:
-                    await transaction.rollback_all()
+                    # Nothing is written until every file has been checked, so
+                    # failing fast only has to drop the staged changes.
                     return MultiEditResult(
                         success=False,
                         state="rolled_back",
-                        files_checked=len(results),
+                        files_checked=i + 1,
                         files_modified=0,
                         total_edits=total_edits,
                         edits_applied=0,
                         edits_failed=edits_failed,
-                        results=results,
+                        results=results[: i + 1],
                         reject_files=reject_files if reject_files else None,
                         transaction_id=transaction_id,
                         can_apply=False,
                         summary=f"Failed and rolled back: {file_result.errors[0] if file_result.errors else 'Unknown error'}",
                     )
 
+            if not args.dry_run and not args.check_only:
+                await transaction.commit(args.create_backup)
+
             for orig, bak in transaction.backup_paths.items():
                 backup_paths[str(orig)] = str(bak)
 
@@ -527,71 +645,116 @@ class MultiEdit(
                 summary=f"Error: {e!s}",
             )
 
+    async def _check_files(
+        self, args: MultiEditArgs, transaction: EditTransaction, workdir: Path
+    ) -> list[FileEditResult]:
+        # Files are independent, so they are checked concurrently and their
+        # new content is staged on the transaction. Entries that name the same
+        # file run in order within one task, each starting from the previous
+        # one's output, so they never race on that file.
+        by_path: dict[Path, list[int]] = {}
+        for i, file_edit in enumerate(args.files):
+            path = self._resolve_path(file_edit.path, workdir)
+            by_path.setdefault(path, []).append(i)
+
+        results: dict[int, FileEditResult] = {}
+
+        async def check_path(path: Path, indices: list[int]) -> None:
+            content: str | None = None
+            for i in indices:
+                results[i], content = await self._process_file(
+                    path, args.files[i], transaction, args, content
+                )
+            original = transaction.original_contents.get(path)
+            if content is not None and content != original:
+                transaction.pending_contents[path] = content
+
+        await asyncio.gather(*(check_path(p, idx) for p, idx in by_path.items()))
+        return [results[i] for i in range(len(args.files))]
+
+    @staticmethod
+    def _resolve_path(path_str: str, workdir: Path) -> Path:
+        path = Path(path_str)
+        if not path.is_absolute():
+            path = workdir / path
+        return path.resolve()
+
     async def _process_file(
         self,
+        path: Path,
         file_edit: FileEdit,
         transaction: EditTransaction,
         args: MultiEditArgs,
-        workdir: Path,
-    ) -> FileEditResult:
-        path = Path(file_edit.path)
-        if not path.is_absolute():
-            path = workdir / path
-        path = path.resolve()
-
-        errors: list[str] = []
-        warnings: list[str] = []
-        block_results: list[EditBlockResult] = []
-
-        if not path.exists():
-            return FileEditResult(
-                path=str(path), success=False, errors=[f"File not found: {path}"]
-            )
+        content: str | None = None,
+    ) -> tuple[FileEditResult, str | None]:
+        if content is None:
+            try:
+                st = path.stat()
+            except OSError:
+                return FileEditResult(
+                    path=str(path), success=False, errors=[f"File not found: {path}"]
+                ), None
 
-        if path.stat().st_size > self.config.max_file_size:
-            return FileEditResult(
-                path=str(path),
-                success=False,
-                errors=[f"File too large: {path.stat().st_size} bytes"],
-            )
+            if st.st_size > self.config.max_file_size:
+                return FileEditResult(
+                    path=str(path),
+                    success=False,
+                    errors=[f"File too large: {st.st_size} bytes"],
+                ), None
 
-        try:
-            content = await transaction.read_file(path)
-        except Exception as e:
-            return FileEditResult(
-                path=str(path), success=False, errors=[f"Failed to read file: {e}"]
-            )
+            try:
+                content = await transaction.read_file(path)
+            except Exception as e:
+                return FileEditResult(
+                    path=str(path), success=False, errors=[f"Failed to read file: {e}"]
+                ), None
 
         if file_edit.expected_hash:
+            # Hashed from the text actually read, so the check covers exactly
+            # what the edits are applied to.
             current_hash = transaction.compute_hash(content)
             if current_hash != file_edit.expected_hash:
                 return FileEditResult(
                     path=str(path),
                     success=False,
                     errors=["File has changed since edit was planned (hash mismatch)"],
-                )
+                ), content
 
-        modified_content = content
+        # Matching, splicing and diffing are pure CPU work; running them off
+        # the event loop keeps it free while other files are checked.
+        return await asyncio.to_thread(
+            self._apply_edits, path, content, file_edit, args.min_confidence
+        )
+
+    def _apply_edits(
+        self, path: Path, content: str, file_edit: FileEdit, min_confidence: float
+    ) -> tuple[FileEditResult, str]:
+        errors: list[str] = []
+        warnings: list[str] = []
+        block_results: list[EditBlockResult] = []
         edits_applied = 0
         reject_parts: list[str] = []
+        # ctx.content is the text as edited so far. The line tables a failed
+        # edit built stay valid for the next edit until one is applied, so
+        # the context is only replaced when the text changes.
+        ctx = MatchContext(content, min_confidence)
 
         for i, edit in enumerate(file_edit.edits):
-            match_result = MatchingEngine.match(
-                modified_content, edit, args.min_confidence
-            )
+            match_result = MatchingEngine.match_in(ctx, edit)
 
             block_result = EditBlockResult(
                 edit_index=i, success=match_result.success, match_result=match_result
             )
 
-            if match_result.success and match_result.confidence >= args.min_confidence:
+            if match_result.success and match_result.confidence >= min_confidence:
                 start = match_result.match_start
                 end = match_result.match_end
 
                 if start is not None and end is not None:
-                    block_result.original_text = modified_content[start:end]
-                    modified_content = (
-                        modified_content[:start] + edit.replace + modified_content[end:]
+                    block_result.original_text = ctx.content[start:end]
+                    ctx = MatchContext(
+                        ctx.content[:start] + edit.replace + ctx.content[end:],
+                        min_confidence,
                     )
                     block_result.applied_text = edit.replace
                     edits_applied += 1
@@ -607,12 +770,8 @@ class MultiEdit(
             block_results.append(block_result)
 
         diff_preview = ""
-        if content != modified_content:
-            diff_preview = DiffGenerator.generate(content, modified_content, str(path))
-        if not args.dry_run and not args.check_only and edits_applied > 0:
-            if args.create_backup:
-                await transaction.create_backup(path)
-            await transaction.apply(path, modified_content)
+        if content != ctx.content:
+            diff_preview = DiffGenerator.generate(content, ctx.content, str(path))
 
         success = len(errors) == 0
 
@@ -626,7 +785,7 @@ class MultiEdit(
             errors=errors,
             warnings=warnings,
             reject_content="\n".join(reject_parts) if reject_parts else None,
-        )
+        ), ctx.content
 
     def _format_reject(self, edit: EditBlock, match: MatchResult) -> str:
         lines = [
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 import asyncio
+from collections import Counter
+from dataclasses import dataclass
+import itertools
 from pathlib import Path
 import re
 import sys
-from typing import TYPE_CHECKING, ClassVar, final
+from typing import TYPE_CHECKING, ClassVar, Literal, final
 
 from pydantic import BaseModel, Field
 
@@ -16,16 +19,46 @@ from vibe.core.tools.base import (
     ToolPermission,
 )
 from vibe.core.tools.ui import ToolCallDisplay, ToolResultDisplay, ToolUIData
+from vibe.core.utils import is_windows, kill_process_tree
 
 if TYPE_CHECKING:
     from vibe.core.types import ToolCallEvent, ToolResultEvent
 
 
 MAX_FAILED_TESTS_DISPLAY = 5
-
-
-class TestResult(BaseModel):
-    __test__ = False
+_READ_CHUNK = 64 * 1024
+# max_output counts characters; a UTF-8 character is at most this many bytes.
+_MAX_CHAR_BYTES = 4
+_TAIL_BYTES = 1024
+
+# Matched against one line at a time. Serial runs print "<node id> STATUS";
+# pytest-xdist workers print "[gwN] [ NN%] STATUS <node id>" instead.
+_TEST_LINE_RE = re.compile(
+    r"(?:(?P<name>[\w/\.]+::[\w]+(?:::[\w]+)?)\s+(?P<status>PASSED|FAILED|ERROR|SKIPPED)"
+    r"|\[gw\d+\]\s+\[\s*\d+%\]\s+(?P<xdist_status>PASSED|FAILED|ERROR|SKIPPED)"
+    r"\s+(?P<xdist_name>[\w/\.]+::[\w]+(?:::[\w]+)?))"
+)
+# pytest's closing line, e.g. "==== 1 failed, 3 passed in 0.12s (0:00:00) ====";
+# the counts in the last one are read with a single scan.
+_SUMMARY_LINE_RE = re.compile(
+    r"^=+ (?P<counts>.+?) in [\d.]+s(?: \([^)]*\))? =+\r?$", re.MULTILINE
+)
+_STATUS_COUNT_RE = re.compile(
+    r"(?P<count>\d+) (?P<status>passed|failed|skipped|errors?)"
+)
+# The TestRunResult count each summary word feeds, where the two differ.
+_STATUS_COUNT_KEYS = {"error": "errors"}
+_FAILED_STATUSES = frozenset({"failed", "error"})
+# pytest exit codes that mean no test ran, so there is no result to parse.
+_NO_TESTS_EXIT_CODES = {4: "usage error", 5: "no tests collected"}
+
+
+# One per reported test line, built from already-parsed values, so a slotted
+# dataclass rather than a validated model; pydantic serializes it as part of
+# TestRunResult all the same.
+@dataclass(slots=True)
+class TestResult:
+    __test__: ClassVar[bool] = False
     name: str
     status: str  # "passed", "failed", "error", "skipped"
     duration: float | None = None
@@ -71,6 +104,10 @@ class TestRunToolConfig(BaseToolConfig):
     permission: ToolPermission = ToolPermission.ASK
     timeout: int = Field(default=120, description="Test timeout in seconds.")
     max_output: int = Field(default=10000, description="Max output characters.")
+    workers: int | Literal["auto"] | None = Field(
+        default=None,
+        description="pytest-xdist workers ('auto' for one per CPU); needs pytest-xdist.",
+    )
 
 
 class TestRunState(BaseToolState):
@@ -123,6 +160,10 @@ class TestRun(
         if args.pattern:
             cmd.extend(["-k", args.pattern])
 
+        # A fail-fast run wants the first failure, not every worker's.
+        if self.config.workers and not args.fail_fast:
+            cmd.extend(["-n", str(self.config.workers), "--dist=loadfile"])
+
         cmd.append("--tb=short")
         cmd.append(f"--timeout={self.config.timeout}")
 
@@ -134,37 +175,89 @@ class TestRun(
         start = time.time()
 
         try:
+            # Its own session lets a timeout take down everything pytest
+            # started (xdist workers, subprocesses under test) with it.
+            kwargs: dict[Literal["start_new_session"], bool] = (
+                {} if is_windows() else {"start_new_session": True}
+            )
             proc = await asyncio.create_subprocess_exec(
                 *cmd,
                 cwd=self.config.effective_workdir,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
+                **kwargs,
             )
 
+            assert proc.stdout is not None and proc.stderr is not None
+            max_stdout = self.config.max_output
+            max_stderr = self.config.max_output // 2
+            output = asyncio.gather(
+                self._read_bounded(proc.stdout, max_stdout * _MAX_CHAR_BYTES),
+                self._read_bounded(proc.stderr, max_stderr * _MAX_CHAR_BYTES),
+                proc.wait(),
+            )
             try:
-                stdout_bytes, stderr_bytes = await asyncio.wait_for(
-                    proc.communicate(), timeout=self.config.timeout + 10
+                out, err, _ = await asyncio.wait_for(
+                    output, timeout=self.config.timeout + 10
                 )
             except TimeoutError:
-                proc.kill()
-                await proc.wait()
+                await kill_process_tree(proc)
                 raise ToolError(f"Tests timed out after {self.config.timeout}s")
 
             duration = time.time() - start
-            stdout = stdout_bytes.decode("utf-8", errors="replace")
-            stderr = stderr_bytes.decode("utf-8", errors="replace")
-
-            stdout = stdout[: self.config.max_output]
-            stderr = stderr[: self.config.max_output // 2]
+            stdout = self._cap_output(*out, max_stdout)
+            stderr = self._cap_output(err[0], b"", max_stderr)
 
             return stdout, stderr, proc.returncode or 0, duration
 
         except FileNotFoundError:
             raise ToolError("pytest not found. Install with: pip install pytest")
 
+    @staticmethod
+    async def _read_bounded(
+        stream: asyncio.StreamReader, limit: int
+    ) -> tuple[bytes, bytes]:
+        # Output past the limit is drained without being kept, so memory stays
+        # bounded however verbose the run is. Of that overflow only the last
+        # line is returned; it is empty when nothing was cut.
+        head = bytearray()
+        tail = b""
+        while chunk := await stream.read(_READ_CHUNK):
+            room = limit - len(head)
+            if room > 0:
+                head += chunk[:room]
+                chunk = chunk[room:]
+            if chunk:
+                tail = (tail + chunk)[-_TAIL_BYTES:]
+        return bytes(head), tail.rstrip().rpartition(b"\n")[2]
+
+    @staticmethod
+    def _cap_output(head: bytes, overflow_line: bytes, limit: int) -> str:
+        # head holds up to _MAX_CHAR_BYTES per allowed character, so the
+        # first limit characters are always whole once decoded.
+        text = head.decode("utf-8", errors="replace")
+        last_line = overflow_line.decode("utf-8", errors="replace")
+        if len(text) > limit:
+            if not last_line:
+                _, sep, tail = text[limit:].rstrip().rpartition("\n")
+                last_line = tail if sep else ""
+            text = text[:limit]
+
+        # The counts come from the summary pytest prints last, so it is kept
+        # even when the output before it was cut short.
+        return f"{text}\n{last_line}" if last_line else text
+
     def _parse_output(
         self, stdout: str, stderr: str, returncode: int, duration: float, max_tests: int
     ) -> TestRunResult:
+        if reason := _NO_TESTS_EXIT_CODES.get(returncode):
+            return TestRunResult(
+                duration=duration,
+                output=stdout + stderr,
+                success=False,
+                summary=f"❌ pytest: {reason} in {duration:.1f}s",
+            )
+
         tests, failed_tests, counts = self._parse_test_lines(stdout, max_tests)
 
         # Override counts with summary info if available
@@ -206,62 +299,39 @@ class TestRun(
     def _parse_test_lines(
         self, stdout: str, max_tests: int
     ) -> tuple[list[TestResult], list[TestResult], dict[str, int]]:
-        tests: list[TestResult] = []
-        failed_tests: list[TestResult] = []
-        counts = {"passed": 0, "failed": 0, "errors": 0, "skipped": 0}
-
-        test_pattern = re.compile(
-            r"^([\w/\.]+::[\w]+(?:::[\w]+)?)\s+(PASSED|FAILED|ERROR|SKIPPED)",
-            re.MULTILINE,
+        # Both forms carry a node id, so a line without "::" is skipped by a
+        # substring check before the pattern is tried at all.
+        matches = (
+            match
+            for line in stdout.split("\n")
+            if "::" in line and (match := _TEST_LINE_RE.match(line))
         )
+        tests = [
+            TestResult(
+                name=match["name"] or match["xdist_name"],
+                status=(match["status"] or match["xdist_status"]).lower(),
+            )
+            for match in itertools.islice(matches, max_tests)
+        ]
+        failed_tests = [test for test in tests if test.status in _FAILED_STATUSES]
 
-        for match in test_pattern.finditer(stdout):
-            if len(tests) >= max_tests:
-                break
-
-            name = match.group(1)
-            status = match.group(2).lower()
-
-            test = TestResult(name=name, status=status)
-            tests.append(test)
-
-            if status == "passed":
-                counts["passed"] += 1
-            elif status == "failed":
-                counts["failed"] += 1
-                failed_tests.append(test)
-            elif status == "error":
-                counts["errors"] += 1
-                failed_tests.append(test)
-            elif status == "skipped":
-                counts["skipped"] += 1
+        counts = {"passed": 0, "failed": 0, "errors": 0, "skipped": 0}
+        for status, count in Counter(test.status for test in tests).items():
+            counts[_STATUS_COUNT_KEYS.get(status, status)] = count
 
         return tests, failed_tests, counts
 
     def _parse_summary(self, stdout: str) -> dict[str, int] | None:
-        counts = {}
-        summary_match = re.search(
-            r"=+\s*(\d+)\s+passed.*?(\d+)?\s*failed.*?in\s+([\d.]+)s",
-            stdout,
-            re.IGNORECASE,
-        )
-        if summary_match:
-            counts["passed"] = int(summary_match.group(1))
-            counts["failed"] = int(summary_match.group(2) or 0)
-            return counts
-
-        alt_summary = re.search(r"=+\s*([\d\w, ]+)\s+in\s+([\d.]+)s\s*=+", stdout)
-        if alt_summary:
-            status_text = alt_summary.group(1)
-            for status in ["passed", "failed", "skipped", "error"]:
-                m = re.search(rf"(\d+)\s+{status}", status_text)
-                if m:
-                    counts[status + "s" if status == "error" else status] = int(
-                        m.group(1)
-                    )
-            return counts
-
-        return None
+        if not (summary_lines := _SUMMARY_LINE_RE.findall(stdout)):
+            return None
+
+        counts: dict[str, int] = {}
+        for match in _STATUS_COUNT_RE.finditer(summary_lines[-1]):
+            status = match["status"].removesuffix("s")
+            counts.setdefault(
+                _STATUS_COUNT_KEYS.get(status, status), int(match["count"])
+            )
+        return counts
 
     @classmethod
     def get_call_display(cls, event: ToolCallEvent) -> ToolCallDisplay:
@@ -1,8 +1,27 @@
 from __future__ import annotations
 
 import ast
+import asyncio
+from dataclasses import dataclass, field
+import hashlib
+import inspect
+import mmap
+import os
 from pathlib import Path
-from typing import TYPE_CHECKING, ClassVar, final
+import re
+import stat
+import time
+from typing import TYPE_CHECKING, Any, ClassVar, final
+
+try:
+    import tree_sitter
+    import tree_sitter_python
+
+    _PY_LANGUAGE = tree_sitter.Language(tree_sitter_python.language())
+    HAS_TREE_SITTER = True
+except ImportError:
+    HAS_TREE_SITTER = False
+    tree_sitter = None
 
 from pydantic import BaseModel, Field
 
@@ -15,18 +34,31 @@ from vibe.core.tools.base import (
 )
 from vibe.core.tools.ui import ToolCallDisplay, ToolResultDisplay, ToolUIData
 
+_TS_DEFINITIONS = frozenset({"function_definition", "class_definition"})
+_AST_FUNCTION_TYPES = (ast.FunctionDef, ast.AsyncFunctionDef)
+
+# Joins annotations/bases wrapped over several lines back onto one line.
+_LINE_BREAK_RE = re.compile(r"\s*\n\s*")
+_BRACKET_PAD_RE = re.compile(r"([\[(]) |,? (?=[\])])")
+
 if TYPE_CHECKING:
+    from tree_sitter import Node, Tree
+
     from vibe.core.types import ToolCallEvent, ToolResultEvent
 
 
-class CodeSymbol(BaseModel):
+# One per outlined definition and built only from parser output, so a plain
+# slotted dataclass rather than a validated model; pydantic still serializes it
+# as part of ViewFileOutlineResult.
+@dataclass(slots=True)
+class CodeSymbol:
     name: str
     type: str  # "class", "function", "method", "variable"
     line_start: int
     line_end: int
     signature: str | None = None
     docstring: str | None = None
-    children: list[CodeSymbol] = Field(default_factory=list)
+    children: list[CodeSymbol] = field(default_factory=list)
 
 
 class ViewFileOutlineArgs(BaseModel):
@@ -53,8 +85,121 @@ class ViewFileOutlineToolConfig(BaseToolConfig):
     max_file_size: int = Field(default=500_000, description="Max file size in bytes.")
 
 
+@dataclass(slots=True)
+class _CachedOutline:
+    # None while the file is too fresh for its stat to be trusted.
+    stat_key: tuple[int, int, int] | None
+    digest: bytes
+    result: ViewFileOutlineResult
+
+
+MAX_TREE_CACHE_ENTRIES = 32
+_AFFIX_BLOCK = 4096
+
+
+def _common_prefix_len(a: bytes, b: bytes) -> int:
+    # Block-wise slice compares run at memcmp speed; only the mismatching
+    # block is narrowed down by bisection.
+    limit = min(len(a), len(b))
+    start = 0
+    while start < limit:
+        end = min(start + _AFFIX_BLOCK, limit)
+        if a[start:end] != b[start:end]:
+            break
+        start = end
+    else:
+        return limit
+
+    lo, hi = start, end - 1
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[start:mid] == b[start:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def _read_if_changed(path: Path, digest: bytes | None) -> tuple[bytes, bytes | None]:
+    """Hash `path` and return its contents only if they no longer match `digest`.
+
+    The file is hashed through a read-only mapping, so an unchanged file whose
+    stat data merely moved (touch, checkout) is never copied into memory.
+    """
+    with path.open("rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return hashlib.blake2b(b"", digest_size=16).digest(), b""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            new_digest = hashlib.blake2b(mm, digest_size=16).digest()
+            return new_digest, None if new_digest == digest else mm[:]
+
+
+def _point(source: bytes, offset: int) -> tuple[int, int]:
+    row = source.count(b"\n", 0, offset)
+    return row, offset - (source.rfind(b"\n", 0, offset) + 1)
+
+
+def _input_edit(old: bytes, new: bytes) -> dict[str, Any]:
+    start = _common_prefix_len(old, new)
+    suffix = _common_prefix_len(old[start:][::-1], new[start:][::-1])
+    old_end, new_end = len(old) - suffix, len(new) - suffix
+    return {
+        "start_byte": start,
+        "old_end_byte": old_end,
+        "new_end_byte": new_end,
+        "start_point": _point(old, start),
+        "old_end_point": _point(old, old_end),
+        "new_end_point": _point(new, new_end),
+    }
+
+
+class _SyntaxTreeCache:
+    """Last tree-sitter tree per file.
+
+    When a file is outlined again after an edit, the previous tree is told
+    which byte range changed and handed back to the parser, which then reuses
+    every subtree outside that range instead of parsing from scratch.
+    """
+
+    def __init__(self, max_entries: int = MAX_TREE_CACHE_ENTRIES) -> None:
+        self._max_entries = max_entries
+        self._trees: dict[str, tuple[bytes, Tree]] = {}
+
+    def __len__(self) -> int:
+        return len(self._trees)
+
+    def parse(self, key: str, source: bytes) -> Tree:
+        assert tree_sitter is not None
+        previous = self._trees.pop(key, None)
+        if previous is not None and previous[0] == source:
+            tree = previous[1]
+        else:
+            # Always hand the parser the whole buffer, never a read callback:
+            # a callable is invoked from C for every chunk the lexer needs,
+            # and per-call Python overhead then dominates the parse.
+            parser = tree_sitter.Parser(_PY_LANGUAGE)
+            if previous is None:
+                tree = parser.parse(source)
+            else:
+                old_source, old_tree = previous
+                old_tree.edit(**_input_edit(old_source, source))
+                tree = parser.parse(source, old_tree)
+
+        self._trees[key] = (source, tree)
+        if len(self._trees) > self._max_entries:
+            del self._trees[next(iter(self._trees))]
+        return tree
+
+
 class ViewFileOutlineState(BaseToolState):
-    pass
+    outline_cache: dict[tuple[str, bool, int], _CachedOutline] = Field(
+        default_factory=dict, exclude=True
+    )
+    tree_cache: _SyntaxTreeCache = Field(default_factory=_SyntaxTreeCache, exclude=True)
+
+
+MAX_OUTLINE_CACHE_ENTRIES = 256
+_RACY_STAT_WINDOW_NS = 1_000_000_000
 
 
 class ViewFileOutline(
@@ -78,20 +223,55 @@ class ViewFileOutline(
 
     @final
     async def run(self, args: ViewFileOutlineArgs) -> ViewFileOutlineResult:
-        file_path = self._prepare_and_validate_path(args)
-        language = self._detect_language(file_path)
+        file_path, st = self._prepare_and_validate_path(args)
+        key = (str(file_path), args.include_docstrings, args.max_depth)
+        stat_key = (st.st_ino, st.st_mtime_ns, st.st_size)
+
+        cache = self.state.outline_cache
+        cached = cache.pop(key, None)
+        if cached is not None and cached.stat_key == stat_key:
+            cache[key] = cached
+            return cached.result
+
+        digest, source = await asyncio.to_thread(
+            _read_if_changed, file_path, cached.digest if cached else None
+        )
+        if cached is None or source is not None:
+            assert source is not None
+            cached = _CachedOutline(
+                None, digest, self._build_outline(file_path, source, args)
+            )
 
-        import asyncio
+        if time.time_ns() - st.st_mtime_ns >= _RACY_STAT_WINDOW_NS:
+            cached.stat_key = stat_key
+        cache[key] = cached
+        if len(cache) > MAX_OUTLINE_CACHE_ENTRIES:
+            del cache[next(iter(cache))]
+        return cached.result
 
-        content = await asyncio.to_thread(
-            file_path.read_text, encoding="utf-8", errors="ignore"
-        )
-        total_lines = len(content.splitlines())
+    def _build_outline(
+        self, file_path: Path, source: bytes, args: ViewFileOutlineArgs
+    ) -> ViewFileOutlineResult:
+        language = self._detect_language(file_path)
+        # Counted in place rather than by splitting the source into a list of
+        # line copies just to take its length.
+        total_lines = source.count(b"\n")
+        if source and not source.endswith(b"\n"):
+            total_lines += 1
 
         if language == "python":
-            symbols = self._parse_python(
-                content, args.include_docstrings, args.max_depth
-            )
+            symbols = None
+            if HAS_TREE_SITTER:
+                tree = self.state.tree_cache.parse(str(file_path), source)
+                symbols = self._parse_python_tree_sitter(
+                    tree, args.include_docstrings, args.max_depth
+                )
+            if symbols is None:
+                symbols = self._parse_python(
+                    source.decode("utf-8", errors="ignore"),
+                    args.include_docstrings,
+                    args.max_depth,
+                )
         else:
             symbols = []
 
@@ -105,7 +285,9 @@ class ViewFileOutline(
             summary=summary,
         )
 
-    def _prepare_and_validate_path(self, args: ViewFileOutlineArgs) -> Path:
+    def _prepare_and_validate_path(
+        self, args: ViewFileOutlineArgs
+    ) -> tuple[Path, os.stat_result]:
         path_str = args.path.strip()
         if not path_str:
             raise ToolError("Path cannot be empty")
@@ -116,14 +298,16 @@ class ViewFileOutline(
 
         file_path = file_path.resolve()
 
-        if not file_path.exists():
+        try:
+            st = file_path.stat()
+        except OSError:
             raise ToolError(f"File not found: {file_path}")
-        if file_path.is_dir():
+        if stat.S_ISDIR(st.st_mode):
             raise ToolError(f"Path is a directory: {file_path}")
-        if file_path.stat().st_size > self.config.max_file_size:
-            raise ToolError(f"File too large: {file_path.stat().st_size} bytes")
+        if st.st_size > self.config.max_file_size:
+            raise ToolError(f"File too large: {st.st_size} bytes")
 
-        return file_path
+        return file_path, st
 
     def _detect_language(self, file_path: Path) -> str:
         ext = file_path.suffix.lower()
@@ -137,70 +321,214 @@ class ViewFileOutline(
         except SyntaxError as e:
             raise ToolError(f"Python syntax error: {e}")
 
-        symbols: list[CodeSymbol] = []
-
-        for node in ast.iter_child_nodes(tree):
-            symbol = self._node_to_symbol(node, include_docstrings, max_depth, depth=1)
-            if symbol:
-                symbols.append(symbol)
-
-        return symbols
+        return self._ast_symbols(tree.body, include_docstrings, max_depth, depth=1)
+
+    def _parse_python_tree_sitter(
+        self, tree: Tree, include_docstrings: bool, max_depth: int
+    ) -> list[CodeSymbol] | None:
+        # Returns None when the tree has errors so the ast path can either
+        # report the SyntaxError or handle syntax this grammar doesn't know.
+        assert tree_sitter is not None
+        if tree.root_node.has_error:
+            return None
+
+        # Mirrors ast.iter_child_nodes: only module-level statements and direct
+        # class members are outlined, so only the module body and class bodies
+        # are visited -- never function bodies or compound statements. This
+        # touches a small fraction of the tree, unlike a query, which has to
+        # match against every node.
+        nodes: list[Node] = []
+        parents: list[int] = []
+        depths: list[int] = []
+        pending: list[tuple[list[Node], int, int]] = [
+            (tree.root_node.named_children, -1, 1)
+        ]
+        while pending:
+            statements, parent, depth = pending.pop()
+            for node in statements:
+                if node.type == "decorated_definition":
+                    node = node.child_by_field_name("definition") or node
+                if node.type not in _TS_DEFINITIONS:
+                    continue
+                nodes.append(node)
+                parents.append(parent)
+                depths.append(depth)
+                body = node.child_by_field_name("body")
+                if node.type == "class_definition" and depth < max_depth and body:
+                    pending.append((body.named_children, len(nodes) - 1, depth + 1))
+
+        # The walk only records flat parent indices; the nested CodeSymbol
+        # view is assembled once at the end.
+        symbols = [self._ts_node_to_symbol(node, include_docstrings) for node in nodes]
+        top_level: list[CodeSymbol] = []
+        for symbol, parent, depth in zip(symbols, parents, depths, strict=True):
+            if parent < 0:
+                top_level.append(symbol)
+                continue
+            if depth > 1 and symbol.type == "function":
+                symbol.type = "method"
+            symbols[parent].children.append(symbol)
+
+        return top_level
+
+    def _ts_node_to_symbol(self, node: Node, include_docstrings: bool) -> CodeSymbol:
+        name = self._ts_text(node.child_by_field_name("name"))
+        if node.type == "class_definition":
+            bases = self._ts_bases(node)
+            signature = (
+                f"class {name}({', '.join(bases)})" if bases else f"class {name}"
+            )
+            symbol_type = "class"
+        else:
+            signature = self._ts_function_signature(node, name)
+            symbol_type = "function"
+
+        docstring = self._ts_docstring(node) if include_docstrings else None
+
+        return CodeSymbol(
+            name=name,
+            type=symbol_type,
+            line_start=node.start_point.row + 1,
+            line_end=self._ts_end_row(node) + 1,
+            signature=signature,
+            docstring=self._preview_docstring(docstring),
+        )
 
-    def _node_to_symbol(
-        self, node: ast.AST, include_docstrings: bool, max_depth: int, depth: int
-    ) -> CodeSymbol | None:
-        if isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef):
-            signature = self._get_function_signature(node)
-            docstring = ast.get_docstring(node) if include_docstrings else None
+    def _preview_docstring(self, docstring: str | None) -> str | None:
+        if docstring is None or len(docstring) <= self.DOCSTRING_PREVIEW_LEN:
+            return docstring
+        return docstring[: self.DOCSTRING_PREVIEW_LEN] + "..."
+
+    def _ts_function_signature(self, node: Node, name: str) -> str:
+        # Same parameter set as the ast path (node.args.args): positional-only
+        # parameters, *args and everything after them are left out.
+        args: list[str] = []
+        parameters = node.child_by_field_name("parameters")
+        for param in parameters.named_children if parameters else ():
+            match param.type:
+                case "identifier":
+                    args.append(self._ts_text(param))
+                case "typed_parameter":
+                    target = param.named_children[0]
+                    if target.type != "identifier":
+                        break
+                    annotation = self._ts_expr(param.child_by_field_name("type"))
+                    args.append(f"{self._ts_text(target)}: {annotation}")
+                case "default_parameter":
+                    args.append(self._ts_text(param.child_by_field_name("name")))
+                case "typed_default_parameter":
+                    arg_name = self._ts_text(param.child_by_field_name("name"))
+                    annotation = self._ts_expr(param.child_by_field_name("type"))
+                    args.append(f"{arg_name}: {annotation}")
+                case "positional_separator":
+                    args.clear()
+                case "comment":
+                    continue
+                case _:
+                    break
+
+        return_type = node.child_by_field_name("return_type")
+        returns = f" -> {self._ts_expr(return_type)}" if return_type else ""
+
+        prefix = "async def" if node.children[0].type == "async" else "def"
+        return f"{prefix} {name}({', '.join(args)}){returns}"
+
+    def _ts_bases(self, node: Node) -> list[str]:
+        superclasses = node.child_by_field_name("superclasses")
+        if superclasses is None:
+            return []
+        return [
+            self._ts_expr(base)
+            for base in superclasses.named_children
+            if base.type not in {"keyword_argument", "comment"}
+        ]
 
-            return CodeSymbol(
-                name=node.name,
-                type="function",
-                line_start=node.lineno,
-                line_end=node.end_lineno or node.lineno,
-                signature=signature,
-                docstring=docstring[: self.DOCSTRING_PREVIEW_LEN] + "..."
-                if docstring and len(docstring) > self.DOCSTRING_PREVIEW_LEN
-                else docstring,
+    def _ts_docstring(self, node: Node) -> str | None:
+        body = node.child_by_field_name("body")
+        first = (
+            next((c for c in body.named_children if c.type != "comment"), None)
+            if body
+            else None
+        )
+        if first is None or first.type != "expression_statement":
+            return None
+        if first.named_child_count != 1 or first.named_children[0].type not in {
+            "string",
+            "concatenated_string",
+        }:
+            return None
+        try:
+            value = ast.literal_eval(self._ts_text(first.named_children[0]))
+        except (ValueError, SyntaxError):
+            return None
+        return inspect.cleandoc(value) if isinstance(value, str) else None
+
+    @staticmethod
+    def _ts_end_row(node: Node) -> int:
+        # tree-sitter blocks swallow trailing comments; ast end_lineno stops at
+        # the last real token, so descend through the last non-comment child.
+        while node.child_count:
+            last = next(
+                (c for c in reversed(node.children) if c.type != "comment"), None
             )
-
-        elif isinstance(node, ast.ClassDef):
-            docstring = ast.get_docstring(node) if include_docstrings else None
+            if last is None:
+                break
+            node = last
+        return node.end_point.row
+
+    def _ts_expr(self, node: Node | None) -> str:
+        text = self._ts_text(node)
+        if "\n" not in text:
+            return text
+        return _BRACKET_PAD_RE.sub(r"\1", _LINE_BREAK_RE.sub(" ", text))
+
+    @staticmethod
+    def _ts_text(node: Node | None) -> str:
+        if node is None or node.text is None:
+            return ""
+        return node.text.decode("utf-8", errors="ignore")
+
+    def _ast_symbols(
+        self, body: list[ast.stmt], include_docstrings: bool, max_depth: int, depth: int
+    ) -> list[CodeSymbol]:
+        # Functions are leaves, so only class bodies are descended into, and a
+        # function found in one is a method from the start.
+        function_type = "function" if depth == 1 else "method"
+        symbols: list[CodeSymbol] = []
+        for node in body:
             children: list[CodeSymbol] = []
-
-            if depth < max_depth:
-                for child in ast.iter_child_nodes(node):
-                    child_symbol = self._node_to_symbol(
-                        child, include_docstrings, max_depth, depth + 1
+            if isinstance(node, _AST_FUNCTION_TYPES):
+                symbol_type = function_type
+                signature = self._get_function_signature(node)
+            elif isinstance(node, ast.ClassDef):
+                symbol_type = "class"
+                bases = [ast.unparse(base) for base in node.bases]
+                signature = (
+                    f"class {node.name}({', '.join(bases)})"
+                    if bases
+                    else f"class {node.name}"
+                )
+                if depth < max_depth:
+                    children = self._ast_symbols(
+                        node.body, include_docstrings, max_depth, depth + 1
                     )
-                    if child_symbol:
-                        child_symbol.type = (
-                            "method"
-                            if child_symbol.type == "function"
-                            else child_symbol.type
-                        )
-                        children.append(child_symbol)
-
-            bases = [self._get_name(base) for base in node.bases]
-            signature = (
-                f"class {node.name}({', '.join(bases)})"
-                if bases
-                else f"class {node.name}"
-            )
+            else:
+                continue
 
-            return CodeSymbol(
-                name=node.name,
-                type="class",
-                line_start=node.lineno,
-                line_end=node.end_lineno or node.lineno,
-                signature=signature,
-                docstring=docstring[: self.DOCSTRING_PREVIEW_LEN] + "..."
-                if docstring and len(docstring) > self.DOCSTRING_PREVIEW_LEN
-                else docstring,
-                children=children,
+            docstring = ast.get_docstring(node) if include_docstrings else None
+            symbols.append(
+                CodeSymbol(
+                    name=node.name,
+                    type=symbol_type,
+                    line_start=node.lineno,
+                    line_end=node.end_lineno or node.lineno,
+                    signature=signature,
+                    docstring=self._preview_docstring(docstring),
+                    children=children,
+                )
             )
 
-        return None
+        return symbols
 
     def _get_function_signature(
         self, node: ast.FunctionDef | ast.AsyncFunctionDef
@@ -209,33 +537,16 @@ class ViewFileOutline(
         for arg in node.args.args:
             arg_str = arg.arg
             if arg.annotation:
-                arg_str += f": {self._get_name(arg.annotation)}"
+                arg_str += f": {ast.unparse(arg.annotation)}"
             args.append(arg_str)
 
         returns = ""
         if node.returns:
-            returns = f" -> {self._get_name(node.returns)}"
+            returns = f" -> {ast.unparse(node.returns)}"
 
         prefix = "async def" if isinstance(node, ast.AsyncFunctionDef) else "def"
         return f"{prefix} {node.name}({', '.join(args)}){returns}"
 
-    def _get_name(self, node: ast.AST) -> str:  # noqa: PLR0911
-        match node:
-            case ast.Name(id=id):
-                return id
-            case ast.Attribute(value=value, attr=attr):
-                return f"{self._get_name(value)}.{attr}"
-            case ast.Subscript(value=value, slice=slice):
-                return f"{self._get_name(value)}[{self._get_name(slice)}]"
-            case ast.Constant(value=value):
-                return repr(value)
-            case ast.Tuple(elts=elts):
-                return f"({', '.join(self._get_name(e) for e in elts)})"
-            case ast.BinOp(left=left, right=right):
-                return f"{self._get_name(left)} | {self._get_name(right)}"
-            case _:
-                return "..."
-
     def _generate_summary(self, symbols: list[CodeSymbol]) -> str:
         classes = sum(1 for s in symbols if s.type == "class")
         functions = sum(1 for s in symbols if s.type == "function")
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+import os
+import time
+from typing import NamedTuple
+
+DEFAULT_MAX_DIRS = 10_000
+
+# Listings whose directory changed this recently are not cached: on filesystems
+# with coarse timestamps a second change in the same tick would leave the
+# mtime untouched and the cached listing stale.
+_RACY_WINDOW_NS = 1_000_000_000
+
+
+class DirEntryRecord(NamedTuple):
+    name: str
+    path: str
+    is_dir: bool
+    is_symlink: bool
+
+
+class DirListingCache:
+    """LRU of directory listings validated by the directory's mtime.
+
+    Adding, removing or renaming an entry bumps the directory's st_mtime_ns,
+    so a single stat() tells whether a cached listing is still current.
+    Only names and entry types are cached; file sizes change without touching
+    the directory and must be read fresh.
+    """
+
+    def __init__(self, max_dirs: int = DEFAULT_MAX_DIRS) -> None:
+        self._max_dirs = max_dirs
+        self._listings: OrderedDict[str, tuple[int, tuple[DirEntryRecord, ...]]] = (
+            OrderedDict()
+        )
+        # Entry counts of directories that were counted but never listed.
+        self._counts: OrderedDict[str, tuple[int, int]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._listings)
+
+    def entries(self, path: str) -> tuple[DirEntryRecord, ...]:
+        """Return the entries of `path`, sorted case-insensitively by name.
+
+        Raises:
+            OSError: If the directory cannot be stat'ed or read.
+        """
+        mtime_ns = os.stat(path).st_mtime_ns
+        cached = self._listings.get(path)
+        if cached is not None and cached[0] == mtime_ns:
+            self._listings.move_to_end(path)
+            return cached[1]
+
+        with os.scandir(path) as it:
+            records = [
+                DirEntryRecord(e.name, e.path, e.is_dir(), e.is_symlink()) for e in it
+            ]
+        records.sort(key=lambda r: r.name.lower())
+        entries = tuple(records)
+
+        self._remember(self._listings, path, mtime_ns, entries)
+        return entries
+
+    def count(self, path: str) -> int:
+        """Return the number of entries in `path`.
+
+        A current cached listing answers directly. Otherwise the entries are
+        counted without building records and only the count is cached, so
+        counting large child directories does not crowd out real listings.
+
+        Raises:
+            OSError: If the directory cannot be stat'ed or read.
+        """
+        mtime_ns = os.stat(path).st_mtime_ns
+        listed = self._listings.get(path)
+        if listed is not None and listed[0] == mtime_ns:
+            return len(listed[1])
+        counted = self._counts.get(path)
+        if counted is not None and counted[0] == mtime_ns:
+            self._counts.move_to_end(path)
+            return counted[1]
+
+        with os.scandir(path) as it:
+            count = sum(1 for _ in it)
+
+        self._remember(self._counts, path, mtime_ns, count)
+        return count
+
+    def _remember[T](
+        self, table: OrderedDict[str, tuple[int, T]], path: str, mtime_ns: int, value: T
+    ) -> None:
+        if time.time_ns() - mtime_ns < _RACY_WINDOW_NS:
+            table.pop(path, None)
+            return
+
+        table[path] = (mtime_ns, value)
+        table.move_to_end(path)
+        if len(table) > self._max_dirs:
+            table.popitem(last=False)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 
 from pydantic import BaseModel, Field
@@ -78,3 +79,10 @@ class ToolUIDataAdapter:
 
         tool_name = getattr(self.tool_class, "get_name", lambda: "tool")()
         return f"Running {tool_name}"
+
+
+@lru_cache(maxsize=256)
+def get_ui_adapter(tool_class: Any) -> ToolUIDataAdapter:
+    # The runtime-checkable Protocol issubclass() in the adapter walks every
+    # protocol member, so adapters are shared per tool class.
+    return ToolUIDataAdapter(tool_class)
@@ -9,6 +9,7 @@ import logging
 import os
 from pathlib import Path
 import re
+import signal
 import sys
 from typing import Any
 
@@ -290,6 +291,36 @@ def is_windows() -> bool:
     return sys.platform == "win32"
 
 
+async def kill_process_tree(proc: asyncio.subprocess.Process) -> None:
+    # On POSIX the process is expected to lead its own session
+    # (start_new_session), so its pid is the group id. The group is killed even
+    # after the leader has exited, since children it started may still be
+    # running and holding its pipes open.
+    try:
+        if sys.platform == "win32":
+            if proc.returncode is not None:
+                return
+            try:
+                subprocess_proc = await asyncio.create_subprocess_exec(
+                    "taskkill",
+                    "/F",
+                    "/T",
+                    "/PID",
+                    str(proc.pid),
+                    stdout=asyncio.subprocess.DEVNULL,
+                    stderr=asyncio.subprocess.DEVNULL,
+                )
+                await subprocess_proc.wait()
+            except (FileNotFoundError, OSError):
+                proc.terminate()
+        else:
+            os.killpg(proc.pid, signal.SIGKILL)
+
+        await proc.wait()
+    except (ProcessLookupError, PermissionError, OSError):
+        pass
+
+
 try:
     import aerofs
 